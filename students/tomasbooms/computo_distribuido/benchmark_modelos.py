@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los Modelos de Ejecución
+Basado en ejemplos_modelos_ejecucion.py
+
+Las demos miden cada modelo una sola vez con relojes de pared, así que sus
+speedups cambian de una corrida a otra. Este script repite cada caso:
+
+- descarta unas corridas de calentamiento (imports, caches, page faults)
+- mide cada repetición con time.perf_counter_ns()
+- opcionalmente fija el proceso (y sus hijos) a un conjunto de CPUs
+- reporta mediana, IQR e intervalo de confianza del 95% (bootstrap)
+- guarda las muestras en JSON/CSV para comparar entre commits y máquinas
+- reporta aparte el arranque del pool de procesos compartido y su costo
+  por tarea, que no entran en los casos medidos
+- con --backends, repite los casos CPU-bound con otros kernels (kernels.py)
+  y separa la ganancia algorítmica, la vectorizada y la de procesos
+- agrega el modelo 6 (subintérpretes / hilos sin GIL) si el intérprete lo
+  permite, y la memoria pico de cada caso en una corrida aparte
+
+Uso:
+    python benchmark_modelos.py --repeticiones 10 --json base.json
+    python benchmark_modelos.py --casos modelo_5_secuencial,modelo_5_paralelo --cpus 0-3
+    python benchmark_modelos.py --json nuevo.json --comparar base.json
+    python benchmark_modelos.py --casos modelo_5_secuencial,modelo_5_paralelo --backends python,numpy,cerrada,pool
+"""
+
+import argparse
+import asyncio
+import csv
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+
+import pool_compartido
+from ejemplos_modelos_ejecucion import (
+    TAREAS_INGREDIENTES,
+    calentar_subinterpretes,
+    gil_activo,
+    gil_procesos,
+    gil_secuencial,
+    gil_subinterpretes,
+    gil_threads,
+    ingredientes_paralelo,
+    ingredientes_secuencial,
+    modelo_1_secuencial,
+    modelo_2_async_no_concurrente,
+    modelo_3_concurrente_no_async,
+    modelo_4_async_concurrente,
+    procesar_ingrediente,
+    soporte_modelo_6,
+)
+from kernels import BACKENDS
+from memoria import MedidorMemoria
+
+
+def ingredientes_pool_nuevo():
+    """Como ingredientes_paralelo, pero creando y cerrando un pool en cada llamada"""
+    with ProcessPoolExecutor(max_workers=len(TAREAS_INGREDIENTES)) as executor:
+        return list(executor.map(procesar_ingrediente, *zip(*TAREAS_INGREDIENTES)))
+
+
+CASOS = {
+    "modelo_1_secuencial": modelo_1_secuencial,
+    "modelo_2_async_no_concurrente": lambda: asyncio.run(modelo_2_async_no_concurrente()),
+    "modelo_3_concurrente_no_async": modelo_3_concurrente_no_async,
+    "modelo_4_async_concurrente": lambda: asyncio.run(modelo_4_async_concurrente()),
+    "modelo_5_secuencial": ingredientes_secuencial,
+    "modelo_5_paralelo": ingredientes_paralelo,
+    "modelo_5_paralelo_pool_nuevo": ingredientes_pool_nuevo,
+    "gil_secuencial": gil_secuencial,
+    "gil_threads": gil_threads,
+    "gil_procesos": gil_procesos,
+}
+# Model 6 only exists where the interpreter supports it
+if soporte_modelo_6()["subinterpretes"]:
+    CASOS["modelo_6_subinterpretes"] = gil_subinterpretes
+if soporte_modelo_6()["free_threaded"]:
+    CASOS["modelo_6_free_threaded"] = gil_threads
+
+# CPU-bound cases that take a kernel backend; with a backend other than
+# python they are measured again as "<caso>@<backend>"
+CON_BACKEND = {
+    "modelo_3_concurrente_no_async": modelo_3_concurrente_no_async,
+    "modelo_5_secuencial": ingredientes_secuencial,
+    "modelo_5_paralelo": ingredientes_paralelo,
+    "gil_secuencial": gil_secuencial,
+    "gil_threads": gil_threads,
+    "gil_procesos": gil_procesos,
+}
+# Their tasks already run inside the pool, where the pool backend cannot split again
+EN_WORKERS = {"modelo_5_paralelo", "gil_procesos"}
+# Cases whose memory includes the worker processes
+CON_HIJOS = EN_WORKERS | {"modelo_5_paralelo_pool_nuevo"}
+
+# Where the gain of each backend over the Python loop comes from
+GANANCIA_BACKEND = {
+    "cerrada": "algorítmica",
+    "numpy": "vectorizada",
+    "pool": "procesos (split + reduce)",
+}
+
+# (base, variante, tipo): speedup = mediana(base) / mediana(variante)
+SPEEDUPS = [
+    ("modelo_5_secuencial", "modelo_5_paralelo", "procesos (una tarea por worker)"),
+    ("modelo_5_paralelo_pool_nuevo", "modelo_5_paralelo", "pool compartido"),
+    ("gil_threads", "gil_procesos", "procesos (una tarea por worker)"),
+    ("modelo_5_secuencial", "modelo_5_paralelo@numpy", "vectorizada + procesos"),
+    ("gil_secuencial", "gil_threads", "hilos"),
+    ("gil_secuencial", "gil_procesos", "procesos (una tarea por worker)"),
+    ("gil_secuencial", "modelo_6_subinterpretes", "subintérpretes"),
+    ("gil_secuencial", "modelo_6_free_threaded", "hilos sin GIL"),
+]
+
+REMUESTREOS = 2000
+
+
+def armar_casos(nombres, backends):
+    """Casos a medir: los pedidos y, para cada backend extra, sus variantes CPU-bound"""
+    casos = {nombre: CASOS[nombre] for nombre in nombres}
+    for backend in backends:
+        if backend == "python":
+            continue
+        for nombre in nombres:
+            if nombre in CON_BACKEND and not (backend == "pool" and nombre in EN_WORKERS):
+                casos[f"{nombre}@{backend}"] = partial(CON_BACKEND[nombre], backend=backend)
+    return casos
+
+
+def pares_speedup(backends):
+    pares = list(SPEEDUPS)
+    for backend in backends:
+        if backend in GANANCIA_BACKEND:
+            pares += [(nombre, f"{nombre}@{backend}", GANANCIA_BACKEND[backend]) for nombre in CON_BACKEND]
+    return pares
+
+
+# =============================================================================
+# ENTORNO
+# =============================================================================
+def parsear_cpus(texto):
+    """'0-3,6' -> {0, 1, 2, 3, 6}"""
+    cpus = set()
+    for parte in texto.split(","):
+        inicio, _, fin = parte.partition("-")
+        cpus.update(range(int(inicio), int(fin or inicio) + 1))
+    return cpus
+
+
+def fijar_cpus(cpus):
+    """Fija el proceso a `cpus`; los procesos hijos heredan la afinidad."""
+    if not hasattr(os, "sched_setaffinity"):
+        print("⚠️  Este sistema no permite fijar CPUs (os.sched_setaffinity), se mide sin fijar")
+        return
+    os.sched_setaffinity(0, cpus)
+
+
+def cpus_asignadas():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return None
+
+
+def commit_actual():
+    try:
+        salida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        )
+        return salida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadatos(args):
+    return {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "sistema": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "gil_activo": gil_activo(),
+        "subinterpretes": soporte_modelo_6()["subinterpretes"],
+        "cpu_count": os.cpu_count(),
+        "cpus": cpus_asignadas(),
+        "commit": commit_actual(),
+        "calentamiento": args.calentamiento,
+        "repeticiones": args.repeticiones,
+        "backends": args.backends.split(","),
+    }
+
+
+@contextmanager
+def silenciar():
+    """Descarta stdout a nivel de descriptor, incluida la salida de procesos hijos."""
+    sys.stdout.flush()
+    original = os.dup(1)
+    with open(os.devnull, "w") as nulo:
+        os.dup2(nulo.fileno(), 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(original, 1)
+        os.close(original)
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+def medir(funcion, calentamiento, repeticiones):
+    """Devuelve los tiempos en ns de `repeticiones` corridas tras el calentamiento."""
+    muestras = []
+    with silenciar():
+        for _ in range(calentamiento):
+            funcion()
+        for _ in range(repeticiones):
+            # Collect garbage from the previous run outside the timed region
+            gc.collect()
+            inicio = time.perf_counter_ns()
+            funcion()
+            muestras.append(time.perf_counter_ns() - inicio)
+    return muestras
+
+
+def medir_memoria(nombre, funcion):
+    """Memoria pico de una corrida extra, aparte de las medidas para no distorsionar los tiempos"""
+    hijos = nombre.split("@")[0] in CON_HIJOS or nombre.endswith("@pool")
+    with silenciar(), MedidorMemoria(hijos) as memoria:
+        funcion()
+    return memoria.pico_mb
+
+
+# =============================================================================
+# ESTADÍSTICA
+# =============================================================================
+def percentil(ordenados, p):
+    """Percentil con interpolación lineal sobre una lista ordenada"""
+    posicion = (len(ordenados) - 1) * p
+    abajo = int(posicion)
+    arriba = min(abajo + 1, len(ordenados) - 1)
+    return ordenados[abajo] + (ordenados[arriba] - ordenados[abajo]) * (posicion - abajo)
+
+
+def intervalo_bootstrap(estimador, rng, nivel=0.95):
+    """Intervalo de percentiles de `estimador(rng)` sobre REMUESTREOS remuestreos"""
+    valores = sorted(estimador(rng) for _ in range(REMUESTREOS))
+    alfa = (1 - nivel) / 2
+    return percentil(valores, alfa), percentil(valores, 1 - alfa)
+
+
+def remuestrear(muestras, rng):
+    return rng.choices(muestras, k=len(muestras))
+
+
+def resumir(muestras, rng):
+    ordenadas = sorted(muestras)
+    q1, q3 = percentil(ordenadas, 0.25), percentil(ordenadas, 0.75)
+    ic_bajo, ic_alto = intervalo_bootstrap(lambda r: statistics.median(remuestrear(muestras, r)), rng)
+    return {
+        "n": len(muestras),
+        "mediana_ns": statistics.median(muestras),
+        "q1_ns": q1,
+        "q3_ns": q3,
+        "iqr_ns": q3 - q1,
+        "min_ns": ordenadas[0],
+        "max_ns": ordenadas[-1],
+        "ic95_ns": [ic_bajo, ic_alto],
+    }
+
+
+def speedup(base, variante, tipo, rng):
+    """Cociente de medianas con su intervalo bootstrap (remuestreo independiente)"""
+    valor = statistics.median(base) / statistics.median(variante)
+    ic = intervalo_bootstrap(
+        lambda r: statistics.median(remuestrear(base, r)) / statistics.median(remuestrear(variante, r)), rng
+    )
+    return {"tipo": tipo, "valor": valor, "ic95": list(ic)}
+
+
+# =============================================================================
+# REPORTE
+# =============================================================================
+def ms(ns):
+    return ns / 1e6
+
+
+def imprimir_pool(pool):
+    print(f"\nPool compartido ({pool['workers']} workers): arranque {pool['arranque_s'] * 1000:.1f}ms, "
+          f"por tarea {pool['por_tarea_us']:.1f}µs de a una / {pool['por_tarea_lotes_us']:.1f}µs en lotes")
+    if "arranque_subinterpretes_s" in pool:
+        print(f"Subintérpretes: arranque {pool['arranque_subinterpretes_s'] * 1000:.1f}ms")
+
+
+def imprimir_resultados(resultados, speedups):
+    print(f"\n{'caso':<40}{'mediana':>11}{'IQR':>10}{'IC 95%':>24}{'memoria':>10}")
+    for nombre, r in resultados.items():
+        ic = f"[{ms(r['ic95_ns'][0]):.1f}, {ms(r['ic95_ns'][1]):.1f}]"
+        memoria = "n/d" if r["memoria_pico_mb"] is None else f"{r['memoria_pico_mb']:.0f}MB"
+        print(f"{nombre:<40}{ms(r['mediana_ns']):>9.1f}ms{ms(r['iqr_ns']):>8.1f}ms{ic:>24}{memoria:>10}")
+    for nombre, s in speedups.items():
+        print(f"⚡ {nombre}: {s['valor']:.2f}x (IC 95% {s['ic95'][0]:.2f}x - {s['ic95'][1]:.2f}x) [{s['tipo']}]")
+
+
+def guardar_json(ruta, informe):
+    with open(ruta, "w") as f:
+        json.dump(informe, f, indent=2, ensure_ascii=False)
+    print(f"✅ JSON guardado en {ruta}")
+
+
+def guardar_csv(ruta, informe):
+    campos = ["caso", "n", "mediana_ns", "q1_ns", "q3_ns", "iqr_ns", "min_ns", "max_ns",
+              "ic95_bajo_ns", "ic95_alto_ns", "memoria_pico_mb", "host", "commit", "python"]
+    meta = informe["metadatos"]
+    with open(ruta, "w", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=campos)
+        escritor.writeheader()
+        for nombre, r in informe["resultados"].items():
+            fila = {k: v for k, v in r.items() if k in campos}
+            fila.update(
+                caso=nombre, ic95_bajo_ns=r["ic95_ns"][0], ic95_alto_ns=r["ic95_ns"][1],
+                host=meta["host"], commit=meta["commit"], python=meta["python"],
+            )
+            escritor.writerow(fila)
+    print(f"✅ CSV guardado en {ruta}")
+
+
+def comparar(ruta, informe):
+    """Compara las medianas con un informe anterior; marca los cambios cuyos IC no se solapan."""
+    with open(ruta) as f:
+        anterior = json.load(f)
+    print(f"\n--- Comparación con {ruta} (commit {anterior['metadatos'].get('commit')}, "
+          f"host {anterior['metadatos'].get('host')}) ---")
+    for nombre, actual in informe["resultados"].items():
+        previo = anterior["resultados"].get(nombre)
+        if previo is None:
+            continue
+        cambio = actual["mediana_ns"] / previo["mediana_ns"] - 1
+        solapan = actual["ic95_ns"][0] <= previo["ic95_ns"][1] and previo["ic95_ns"][0] <= actual["ic95_ns"][1]
+        marca = "≈" if solapan else ("❌" if cambio > 0 else "✅")
+        print(f"{marca} {nombre:<40}{ms(previo['mediana_ns']):>9.1f}ms -> {ms(actual['mediana_ns']):>9.1f}ms ({cambio:+.1%})")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--casos", default=",".join(CASOS), help="Casos separados por coma")
+    parser.add_argument("--backends", default="python",
+                        help=f"Kernels para los casos CPU-bound, separados por coma ({', '.join(BACKENDS)})")
+    parser.add_argument("--calentamiento", type=int, default=1, help="Corridas descartadas por caso")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Corridas medidas por caso")
+    parser.add_argument("--cpus", help="CPUs a las que fijar el proceso, p. ej. 0-3 o 0,2")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla del bootstrap")
+    parser.add_argument("--json", help="Archivo donde guardar el informe completo")
+    parser.add_argument("--csv", help="Archivo donde guardar un resumen por caso")
+    parser.add_argument("--comparar", help="Informe JSON anterior contra el que comparar")
+    args = parser.parse_args()
+
+    nombres = args.casos.split(",")
+    desconocidos = [c for c in nombres if c not in CASOS]
+    if desconocidos:
+        parser.error(f"casos desconocidos: {', '.join(desconocidos)} (disponibles: {', '.join(CASOS)})")
+    backends = args.backends.split(",")
+    desconocidos = [b for b in backends if b not in BACKENDS]
+    if desconocidos:
+        parser.error(f"backends desconocidos: {', '.join(desconocidos)} (disponibles: {', '.join(BACKENDS)})")
+    casos = armar_casos(nombres, backends)
+    if args.repeticiones < 2:
+        parser.error("--repeticiones debe ser al menos 2")
+    if args.cpus:
+        fijar_cpus(parsear_cpus(args.cpus))
+
+    rng = random.Random(args.semilla)
+    meta = metadatos(args)
+    print(f"Python {meta['python']} en {meta['host']}, CPUs {meta['cpus'] or meta['cpu_count']}")
+    # Measured from a cold pool; the cases then run on the warm one. Workers
+    # inherit fd 1 when they start, so start them with stdout silenced too
+    with silenciar():
+        pool = pool_compartido.costos()
+        if "modelo_6_subinterpretes" in casos:
+            # Same for the interpreter pool, so the comparison is not biased by start-up
+            pool["arranque_subinterpretes_s"] = calentar_subinterpretes()
+
+    muestras, memoria = {}, {}
+    for nombre, funcion in casos.items():
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {nombre}...", flush=True)
+        muestras[nombre] = medir(funcion, args.calentamiento, args.repeticiones)
+        memoria[nombre] = medir_memoria(nombre, funcion)
+
+    resultados = {nombre: resumir(m, rng) for nombre, m in muestras.items()}
+    for nombre in resultados:
+        resultados[nombre]["memoria_pico_mb"] = memoria[nombre]
+        resultados[nombre]["muestras_ns"] = muestras[nombre]
+    speedups = {
+        f"{base} / {variante}": speedup(muestras[base], muestras[variante], tipo, rng)
+        for base, variante, tipo in pares_speedup(backends)
+        if base in muestras and variante in muestras
+    }
+    informe = {"metadatos": meta, "pool": pool, "resultados": resultados, "speedups": speedups}
+
+    imprimir_pool(pool)
+    imprimir_resultados(resultados, speedups)
+    if args.json:
+        guardar_json(args.json, informe)
+    if args.csv:
+        guardar_csv(args.csv, informe)
+    if args.comparar:
+        comparar(args.comparar, informe)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Ejemplos de Modelos de Ejecución Computacional
+Basado en los materiales de professor/computo_distribuido/
+
+Este archivo demuestra los 5 modelos principales con la analogía de la cocina,
+más un sexto (subintérpretes / free-threading) cuando el intérprete lo permite.
+Cada demo mide una sola vez; `benchmark_modelos.py` repite las mediciones y
+reporta mediana, IQR e intervalos de confianza.
+
+Los modelos CPU-bound (3, 5 y la demo del GIL) aceptan un backend para el
+cálculo (ver kernels.py):
+    python ejemplos_modelos_ejecucion.py --backend numpy
+"""
+
+import argparse
+import asyncio
+import atexit
+import sys
+import threading
+import time
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from kernels import BACKENDS, backend_para_workers, suma_rango
+from memoria import MedidorMemoria
+from pool_compartido import calentar, mapear
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor  # Python 3.14+
+except ImportError:
+    InterpreterPoolExecutor = None
+
+try:
+    from memoria_compartida import modelo_5_memoria_compartida  # requiere NumPy
+except ImportError:
+    modelo_5_memoria_compartida = None
+
+
+def timestamp():
+    """Retorna timestamp legible HH:MM:SS.mmm"""
+    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+
+
+# =============================================================================
+# MODELO 1: SECUENCIAL
+# =============================================================================
+def modelo_1_secuencial():
+    """
+    Un chef hace una orden completa antes de iniciar la siguiente.
+    No hay concurrencia ni aprovechamiento de esperas.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 1: SECUENCIAL")
+    print(f"{'='*70}")
+    
+    def preparar_cafe():
+        print(f"[{timestamp()}] ☕ Café: moler granos...")
+        time.sleep(1)
+        print(f"[{timestamp()}] ☕ Café: hervir agua...")
+        time.sleep(1)
+        print(f"[{timestamp()}] ☕ Café: LISTO")
+    
+    def tostar_pan():
+        print(f"[{timestamp()}] 🍞 Pan: meter en tostadora...")
+        time.sleep(0.5)
+        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+    
+    inicio = time.perf_counter()
+    preparar_cafe()  # Espera a que termine
+    tostar_pan()     # Solo entonces inicia
+    tiempo_total = time.perf_counter() - inicio
+    
+    print(f"⏱️  Tiempo total: {tiempo_total:.2f}s (suma de todas las tareas)")
+
+
+# =============================================================================
+# MODELO 2: ASÍNCRONO pero NO CONCURRENTE
+# =============================================================================
+async def modelo_2_async_no_concurrente():
+    """
+    El chef puede esperar (await), pero no inicia otra orden mientras espera.
+    CPU ociosa durante las esperas.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 2: ASÍNCRONO pero NO CONCURRENTE")
+    print(f"{'='*70}")
+    
+    async def preparar_cafe():
+        print(f"[{timestamp()}] ☕ Café: inicio cafetera...")
+        await asyncio.sleep(1)  # Espera (wait)
+        print(f"[{timestamp()}] ☕ Café: LISTO")
+    
+    async def tostar_pan():
+        print(f"[{timestamp()}] 🍞 Pan: inicio tostadora...")
+        await asyncio.sleep(0.5)  # Espera (wait)
+        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+    
+    inicio = time.perf_counter()
+    await preparar_cafe()  # Espera a que termine (no aprovecha el wait)
+    await tostar_pan()     # Solo entonces inicia
+    tiempo_total = time.perf_counter() - inicio
+    
+    print(f"⏱️  Tiempo total: {tiempo_total:.2f}s (CPU ociosa durante waits)")
+
+
+# =============================================================================
+# MODELO 3: CONCURRENTE pero NO ASÍNCRONO
+# =============================================================================
+def modelo_3_concurrente_no_async(backend="python"):
+    """
+    Tres tareas CPU-bound que se alternan por time-slicing.
+    No hay esperas reales, solo cambios de contexto.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 3: CONCURRENTE pero NO ASÍNCRONO (time-slicing)")
+    print(f"{'='*70}")
+    
+    def tarea_cpu_intensiva(nombre, iteraciones):
+        print(f"[{timestamp()}] {nombre}: INICIO")
+        resultado = suma_rango(iteraciones, backend)
+        print(f"[{timestamp()}] {nombre}: FIN (resultado={resultado})")
+    
+    inicio = time.perf_counter()
+    
+    # Crear 3 hilos (se alternan en CPU por time-slicing)
+    hilos = [
+        threading.Thread(target=tarea_cpu_intensiva, args=("🥘 Risotto", 5_000_000)),
+        threading.Thread(target=tarea_cpu_intensiva, args=("🍲 Salsa", 5_000_000)),
+        threading.Thread(target=tarea_cpu_intensiva, args=("🥗 Vegetales", 5_000_000)),
+    ]
+    
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    
+    tiempo_total = time.perf_counter() - inicio
+    print(f"⏱️  Tiempo total: {tiempo_total:.2f}s (alternancia, sin paralelismo por GIL)")
+
+
+# =============================================================================
+# MODELO 4: ASÍNCRONO Y CONCURRENTE (sin paralelismo)
+# =============================================================================
+async def modelo_4_async_concurrente():
+    """
+    El chef inicia cafetera Y tostadora casi simultáneamente.
+    Mientras ambas esperan, puede hacer otras cosas.
+    Aprovecha los waits para ejecutar otras tareas.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 4: ASÍNCRONO Y CONCURRENTE (event loop)")
+    print(f"{'='*70}")
+    
+    async def preparar_cafe():
+        print(f"[{timestamp()}] ☕ Café: inicio cafetera...")
+        await asyncio.sleep(1)  # Espera (wait) - libera CPU
+        print(f"[{timestamp()}] ☕ Café: LISTO")
+        return "café"
+    
+    async def tostar_pan():
+        print(f"[{timestamp()}] 🍞 Pan: inicio tostadora...")
+        await asyncio.sleep(0.5)  # Espera (wait) - libera CPU
+        print(f"[{timestamp()}] 🍞 Pan: LISTO")
+        return "pan"
+    
+    async def cortar_fruta():
+        print(f"[{timestamp()}] 🍎 Fruta: cortando...")
+        await asyncio.sleep(0.3)  # Trabajo
+        print(f"[{timestamp()}] 🍎 Fruta: LISTO")
+        return "fruta"
+    
+    inicio = time.perf_counter()
+    # gather() ejecuta todas concurrentemente, aprovechando waits
+    resultados = await asyncio.gather(preparar_cafe(), tostar_pan(), cortar_fruta())
+    tiempo_total = time.perf_counter() - inicio
+    
+    print(f"✅ Resultados: {resultados}")
+    print(f"⏱️  Tiempo total: {tiempo_total:.2f}s (máximo de las tareas, NO la suma)")
+
+
+# =============================================================================
+# MODELO 5: PARALELO (múltiples cores)
+# =============================================================================
+def procesar_ingrediente(nombre, complejidad, backend="python"):
+    """Función auxiliar para procesamiento paralelo (debe estar a nivel módulo)"""
+    pid = os.getpid()
+    print(f"[{timestamp()}] {nombre}: INICIO (PID {pid})")
+    resultado = suma_rango(complejidad, backend)  # CPU-bound
+    print(f"[{timestamp()}] {nombre}: FIN (PID {pid}, resultado={resultado})")
+    return resultado
+
+
+TAREAS_INGREDIENTES = [
+    ("🥔 Papas", 8_000_000),
+    ("🥕 Zanahorias", 6_000_000),
+    ("🧅 Cebollas", 5_000_000),
+]
+
+
+def ingredientes_secuencial(tareas=TAREAS_INGREDIENTES, backend="python"):
+    """Procesa los ingredientes uno tras otro en el proceso actual"""
+    return [procesar_ingrediente(nombre, complejidad, backend) for nombre, complejidad in tareas]
+
+
+def ingredientes_paralelo(tareas=TAREAS_INGREDIENTES, backend="python"):
+    """Reparte los ingredientes entre los procesos del pool compartido"""
+    return mapear(
+        procesar_ingrediente,
+        [t[0] for t in tareas],
+        [t[1] for t in tareas],
+        [backend] * len(tareas)
+    )
+
+
+def modelo_5_paralelo(backend="python"):
+    """
+    Múltiples chefs (cores) trabajan simultáneamente.
+    Paralelismo real en múltiples CPUs.
+    """
+    print(f"\n{'='*70}")
+    print(f"MODELO 5: PARALELO (múltiples cores)")
+    print(f"{'='*70}")
+    print(f"Sistema: {os.cpu_count()} cores disponibles")
+    
+    # Comparación: Secuencial vs Paralelo
+    print("\n--- SECUENCIAL (baseline) ---")
+    inicio = time.perf_counter()
+    ingredientes_secuencial(backend=backend)
+    tiempo_seq = time.perf_counter() - inicio
+    print(f"⏱️  Secuencial: {tiempo_seq:.2f}s")
+    
+    print("\n--- PARALELO (múltiples procesos) ---")
+    # Start the processes outside the timed region; it is paid once
+    print(f"🚀 Arranque del pool: {calentar():.2f}s (una sola vez, compartido)")
+    inicio = time.perf_counter()
+    ingredientes_paralelo(backend=backend_para_workers(backend))
+    tiempo_par = time.perf_counter() - inicio
+    print(f"⏱️  Paralelo: {tiempo_par:.2f}s")
+    print(f"⚡ Speedup: {tiempo_seq/tiempo_par:.2f}x")
+    print("(Una sola medición: para comparar usar benchmark_modelos.py)")
+
+
+# =============================================================================
+# DEMOSTRACIÓN: Threading vs Multiprocessing para CPU-bound
+# =============================================================================
+def tarea_cpu(n, backend="python"):
+    """Función auxiliar para demo GIL (debe estar a nivel módulo)"""
+    return suma_rango(n, backend)
+
+
+DATOS_GIL = [10_000_000, 10_000_000]
+
+
+def gil_secuencial(datos=DATOS_GIL, backend="python"):
+    """Ejecuta tarea_cpu una tras otra en el hilo actual (referencia)"""
+    return [tarea_cpu(n, backend) for n in datos]
+
+
+def gil_threads(datos=DATOS_GIL, backend="python"):
+    """Ejecuta tarea_cpu en hilos (limitados por el GIL)"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return list(executor.map(tarea_cpu, datos, [backend] * len(datos)))
+
+
+def gil_procesos(datos=DATOS_GIL, backend="python"):
+    """Ejecuta tarea_cpu en los procesos del pool compartido (cada uno con su GIL)"""
+    return mapear(tarea_cpu, datos, [backend] * len(datos))
+
+
+def demo_gil(backend="python"):
+    """
+    Demuestra el impacto del GIL en tareas CPU-bound.
+    Threading NO da paralelismo, Multiprocessing SÍ.
+    """
+    print(f"\n{'='*70}")
+    print("DEMOSTRACIÓN: Impacto del GIL en CPU-bound")
+    print(f"{'='*70}")
+    
+    # ThreadPoolExecutor (limitado por GIL)
+    print("--- Threading (limitado por GIL) ---")
+    inicio = time.perf_counter()
+    gil_threads(backend=backend)
+    tiempo_threading = time.perf_counter() - inicio
+    print(f"⏱️  Threading: {tiempo_threading:.2f}s (casi secuencial)")
+    
+    # ProcessPoolExecutor (sin GIL)
+    print("\n--- Multiprocessing (sin GIL) ---")
+    print(f"🚀 Arranque del pool: {calentar():.2f}s (0 si ya estaba arrancado)")
+    inicio = time.perf_counter()
+    gil_procesos(backend=backend_para_workers(backend))
+    tiempo_multiproc = time.perf_counter() - inicio
+    print(f"⏱️  Multiprocessing: {tiempo_multiproc:.2f}s (paralelismo real)")
+    print(f"⚡ Speedup: {tiempo_threading/tiempo_multiproc:.2f}x")
+
+
+# =============================================================================
+# MODELO 6: PARALELO EN UN SOLO PROCESO (subintérpretes / free-threading)
+# =============================================================================
+_interpretes = None
+_interpretes_calientes = False
+
+
+def gil_activo():
+    """False en un build free-threaded (3.13t+) que corre con el GIL desactivado"""
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def soporte_modelo_6():
+    return {
+        "subinterpretes": InterpreterPoolExecutor is not None,
+        "free_threaded": not gil_activo(),
+    }
+
+
+def _pool_interpretes():
+    global _interpretes
+    if InterpreterPoolExecutor is None:
+        raise RuntimeError("Los subintérpretes requieren Python 3.14+ (concurrent.futures.InterpreterPoolExecutor)")
+    if _interpretes is None:
+        # Kept alive like the process pool, so only the first call pays the start-up
+        _interpretes = InterpreterPoolExecutor(max_workers=os.cpu_count() or 1)
+        atexit.register(_interpretes.shutdown)
+    return _interpretes
+
+
+def calentar_subinterpretes():
+    """
+    Arranca los subintérpretes antes de medir, como calentar() con el pool
+    de procesos, y devuelve los segundos que tardó (0 si ya estaban).
+    """
+    global _interpretes_calientes
+    if _interpretes_calientes:
+        return 0.0
+    inicio = time.perf_counter()
+    pool = _pool_interpretes()
+    # Like the process pool, threads (and their interpreters) start on demand;
+    # a builtin that sleeps keeps each one busy so every task starts a new one
+    list(pool.map(time.sleep, [0.01] * (os.cpu_count() or 1)))
+    _interpretes_calientes = True
+    return time.perf_counter() - inicio
+
+
+def gil_subinterpretes(datos=DATOS_GIL, backend="python"):
+    """
+    Ejecuta las sumas en subintérpretes del mismo proceso, cada uno con su
+    propio GIL (Python 3.14+). Solo backend python: cada subintérprete
+    importa sus módulos desde cero y NumPy no se puede cargar en ellos.
+    """
+    if backend != "python":
+        raise ValueError("Los subintérpretes solo ejecutan el backend python")
+    pool = _pool_interpretes()
+    # Only builtins cross the boundary: sum and range need no imports in the
+    # subinterpreter, unlike a function from this module
+    return list(pool.map(sum, [range(n) for n in datos]))
+
+
+def _medir(nombre, funcion, backend, hijos=False):
+    # Only the model that uses the process pool is charged for its workers
+    with MedidorMemoria(hijos) as memoria:
+        inicio = time.perf_counter()
+        funcion(backend=backend)
+        segundos = time.perf_counter() - inicio
+    pico = f"{memoria.pico_mb:.0f} MB" if memoria.pico_mb is not None else "n/d"
+    print(f"⏱️  {nombre:<28} {segundos:6.2f}s   memoria pico: {pico}")
+    return segundos
+
+
+def modelo_6_sin_gil(backend="python"):
+    """
+    Paralelismo de CPU sin crear procesos: subintérpretes (un GIL por
+    intérprete) o hilos en un build free-threaded (sin GIL). Se compara con
+    hilos y procesos sobre las mismas sumas de la demo del GIL.
+    """
+    print(f"\n{'='*70}")
+    print("MODELO 6: PARALELO EN UN SOLO PROCESO (subintérpretes / free-threading)")
+    print(f"{'='*70}")
+    soporte = soporte_modelo_6()
+    print(f"Python {sys.version.split()[0]}: subintérpretes {'✅' if soporte['subinterpretes'] else '❌'}, "
+          f"GIL {'desactivado ✅' if soporte['free_threaded'] else 'activo'}")
+    
+    calentar()
+    tiempos = {
+        "secuencial": _medir("Secuencial", gil_secuencial, backend),
+        "hilos": _medir("Hilos" + (" (sin GIL)" if soporte["free_threaded"] else " (con GIL)"), gil_threads, backend),
+        "procesos": _medir("Procesos (pool compartido)", gil_procesos, backend_para_workers(backend), hijos=True),
+    }
+    if soporte["subinterpretes"] and backend == "python":
+        # Warmed like the process pool above, so neither model pays its start-up here
+        print(f"🚀 Arranque de los subintérpretes: {calentar_subinterpretes():.2f}s")
+        tiempos["subintérpretes"] = _medir("Subintérpretes", gil_subinterpretes, backend)
+    elif soporte["subinterpretes"]:
+        print("ℹ️  Subintérpretes: solo con --backend python, se omiten")
+    if not soporte["subinterpretes"] and not soporte["free_threaded"]:
+        print("ℹ️  Sin subintérpretes (Python 3.14+) ni build free-threaded (3.13t+): "
+              "solo se comparan hilos y procesos")
+    
+    for nombre, segundos in tiempos.items():
+        if nombre != "secuencial":
+            print(f"⚡ Speedup {nombre}: {tiempos['secuencial'] / segundos:.2f}x")
+
+
+# =============================================================================
+# MAIN: Ejecutar todos los ejemplos
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Ejemplos de modelos de ejecución")
+    parser.add_argument("--backend", choices=BACKENDS, default="python",
+                        help="Cómo calcular las sumas de los modelos CPU-bound")
+    args = parser.parse_args()
+
+    print("\n" + "="*70)
+    print("EJEMPLOS DE MODELOS DE EJECUCIÓN COMPUTACIONAL")
+    print("Basado en: professor/computo_distribuido/")
+    print(f"Backend de cálculo: {args.backend}")
+    print("="*70)
+    
+    # Modelo 1: Secuencial
+    modelo_1_secuencial()
+    
+    # Modelo 2: Async no concurrente
+    asyncio.run(modelo_2_async_no_concurrente())
+    
+    # Modelo 3: Concurrente no async
+    modelo_3_concurrente_no_async(args.backend)
+    
+    # Modelo 4: Async concurrente
+    asyncio.run(modelo_4_async_concurrente())
+    
+    # Modelo 5: Paralelo
+    modelo_5_paralelo(args.backend)
+    
+    # Modelo 5 con arrays grandes: pickle vs memoria compartida
+    if modelo_5_memoria_compartida is not None:
+        modelo_5_memoria_compartida()
+    else:
+        print("\nℹ️  Modelo 5 con memoria compartida: requiere NumPy, se omite")
+    
+    # Demo GIL
+    demo_gil(args.backend)
+    
+    # Modelo 6: subintérpretes / free-threading (si el intérprete lo permite)
+    modelo_6_sin_gil(args.backend)
+    
+    print("\n" + "="*70)
+    print("RESUMEN DE DECISIONES:")
+    print("="*70)
+    print("✅ I/O-bound + librerías async  → asyncio (Modelo 4)")
+    print("✅ I/O-bound + librerías sync   → ThreadPoolExecutor")
+    print("✅ CPU-bound                    → ProcessPoolExecutor (Modelo 5)")
+    print("✅ CPU-bound sin copiar memoria → subintérpretes / free-threading (Modelo 6)")
+    print("✅ Tarea simple                 → Secuencial (Modelo 1)")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
+
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Kernels CPU-bound de las demos con varios backends intercambiables.
+
+Las demos calculan sum(range(n)) y sum(i**2 for i in range(n)) con bucles
+interpretados. Cada backend calcula lo mismo de otra forma, para separar de
+dónde sale cada ganancia:
+
+- python:  el bucle original (referencia)
+- numpy:   np.arange + sum por bloques (vectorizado, memoria acotada)
+- cerrada: fórmula cerrada, O(1) (ganancia algorítmica)
+- pool:    el rango se reparte entre los procesos del pool compartido y se
+           suman los parciales (ganancia por procesos)
+
+Uso:
+    from kernels import suma_rango, suma_cuadrados
+    suma_rango(20_000_000, backend="numpy")
+"""
+
+import multiprocessing
+
+from pool_compartido import cantidad_workers, mapear
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only its backend needs it
+    np = None
+
+BACKENDS = ("python", "numpy", "cerrada", "pool")
+
+# Elements per NumPy block: 8 MB of int64 regardless of n
+BLOQUE = 1 << 20
+INT64_MAX = (1 << 63) - 1
+
+
+# =============================================================================
+# PYTHON (referencia)
+# =============================================================================
+def _python(inicio, fin, potencia):
+    if potencia == 1:
+        return sum(range(inicio, fin))
+    return sum(i**2 for i in range(inicio, fin))
+
+
+# =============================================================================
+# NUMPY (vectorizado por bloques)
+# =============================================================================
+def _numpy(inicio, fin, potencia):
+    if np is None:
+        raise RuntimeError("El backend numpy requiere NumPy (pip install numpy)")
+    # Each block is summed in int64, so keep block sums below its maximum;
+    # the running total is a Python int and cannot overflow
+    mayor = max(abs(inicio), abs(fin)) ** potencia or 1
+    bloque = max(1, min(BLOQUE, INT64_MAX // mayor))
+    total = 0
+    for desde in range(inicio, fin, bloque):
+        valores = np.arange(desde, min(desde + bloque, fin), dtype=np.int64)
+        if potencia == 2:
+            valores *= valores
+        total += int(valores.sum())
+    return total
+
+
+# =============================================================================
+# FÓRMULA CERRADA
+# =============================================================================
+def _prefijo(n, potencia):
+    """Suma de i**potencia para i en range(n)"""
+    if n <= 0:
+        return 0
+    if potencia == 1:
+        return n * (n - 1) // 2
+    return (n - 1) * n * (2 * n - 1) // 6
+
+
+def _cerrada(inicio, fin, potencia):
+    return _prefijo(fin, potencia) - _prefijo(inicio, potencia)
+
+
+# =============================================================================
+# POOL (split + reduce)
+# =============================================================================
+def _tramo(argumentos):
+    inicio, fin, potencia = argumentos
+    return _python(inicio, fin, potencia)
+
+
+def _pool(inicio, fin, potencia, partes=None):
+    if multiprocessing.parent_process() is not None:
+        # A worker would start a pool of its own inside the shared one
+        raise RuntimeError("El backend pool no se puede usar dentro de un proceso del pool")
+    partes = partes or cantidad_workers()
+    paso = max(1, -(-(fin - inicio) // partes))
+    tramos = [(desde, min(desde + paso, fin), potencia) for desde in range(inicio, fin, paso)]
+    return sum(mapear(_tramo, tramos, chunksize=1))
+
+
+_KERNELS = {"python": _python, "numpy": _numpy, "cerrada": _cerrada, "pool": _pool}
+
+
+def _kernel(backend):
+    try:
+        return _KERNELS[backend]
+    except KeyError:
+        raise ValueError(f"Backend desconocido: {backend} (disponibles: {', '.join(BACKENDS)})")
+
+
+def backend_para_workers(backend):
+    """Backend a usar en tareas que ya corren en el pool: no se puede volver a repartir"""
+    return "python" if backend == "pool" else backend
+
+
+def suma_rango(n, backend="python"):
+    """sum(range(n)) con el backend indicado"""
+    return _kernel(backend)(0, n, 1)
+
+
+def suma_cuadrados(n, backend="python"):
+    """sum(i**2 for i in range(n)) con el backend indicado"""
+    return _kernel(backend)(0, n, 2)
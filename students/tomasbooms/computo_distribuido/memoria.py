@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Memoria residente (RSS) de un bloque de código: la del proceso actual y,
+con `hijos=True`, también la de sus procesos hijos (por ejemplo los workers
+de un ProcessPoolExecutor).
+
+Un hilo muestrea /proc cada `intervalo` segundos mientras dura el bloque y
+guarda el pico. Solo funciona en Linux; en otros sistemas los valores quedan
+en None.
+
+Uso:
+    with MedidorMemoria(hijos=True) as memoria:
+        trabajo()
+    print(memoria.pico_mb, memoria.extra_mb)
+"""
+
+import multiprocessing
+import os
+import threading
+
+_PAGINA = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes(pid="self"):
+    """RSS de un proceso leída de /proc, o None si no se puede leer"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * _PAGINA
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def rss_total(hijos=True):
+    """RSS del proceso actual, más la de sus hijos vivos si `hijos`"""
+    propio = rss_bytes()
+    if propio is None or not hijos:
+        return propio
+    # A child that exits between listing and reading simply counts as 0
+    return propio + sum(rss_bytes(hijo.pid) or 0 for hijo in multiprocessing.active_children())
+
+
+class MedidorMemoria:
+    def __init__(self, hijos=False, intervalo=0.005):
+        self.hijos = hijos
+        self.intervalo = intervalo
+        self.base = None
+        self.pico = None
+        self._parar = threading.Event()
+        self._hilo = None
+
+    def __enter__(self):
+        self.base = self.pico = rss_total(self.hijos)
+        if self.base is not None:
+            self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+            self._hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._parar.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        self._registrar(rss_total(self.hijos))
+
+    def _muestrear(self):
+        while not self._parar.wait(self.intervalo):
+            self._registrar(rss_total(self.hijos))
+
+    def _registrar(self, valor):
+        if valor is not None and self.pico is not None:
+            self.pico = max(self.pico, valor)
+
+    @property
+    def pico_mb(self):
+        return None if self.pico is None else self.pico / 2**20
+
+    @property
+    def extra_mb(self):
+        """Pico menos la memoria que ya había al empezar"""
+        return None if self.pico is None else (self.pico - self.base) / 2**20
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Modelo 5 con memoria compartida: pasar arrays grandes a los workers sin copiarlos.
+
+Con ProcessPoolExecutor cada argumento y cada resultado se serializa con
+pickle y viaja por un pipe: para un array de 80 MB eso son 80 MB de ida y
+80 MB de vuelta, y la copia puede costar más que el cálculo. Aquí hay dos
+variantes del mismo trabajo (y = sqrt(x) * 2 + 1 por tramos):
+
+- pickle:     cada worker recibe su tramo y devuelve el resultado (copias)
+- compartida: entrada y salida viven en multiprocessing.shared_memory; los
+              workers reciben solo el nombre del bloque y los índices de su
+              tramo, leen la entrada y escriben el resultado en su lugar
+
+Uso:
+    python memoria_compartida.py --tamanos 100000,1000000,10000000 --repeticiones 5
+    python memoria_compartida.py --json memoria_compartida.json
+"""
+
+import argparse
+import json
+import pickle
+import statistics
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pool_compartido import calentar, cantidad_workers, mapear
+
+TIPO = np.float64
+
+
+# =============================================================================
+# TRABAJO
+# =============================================================================
+def calcular(entrada, salida):
+    """El cálculo de cada tramo, escrito en `salida` sin arrays temporales"""
+    np.sqrt(entrada, out=salida)
+    salida *= 2
+    salida += 1
+
+
+def tramos(n, partes):
+    """Índices (inicio, fin) de `partes` tramos contiguos de un array de n elementos"""
+    limites = np.linspace(0, n, partes + 1, dtype=np.int64)
+    return [(int(a), int(b)) for a, b in zip(limites[:-1], limites[1:]) if b > a]
+
+
+# =============================================================================
+# VARIANTE PICKLE (referencia)
+# =============================================================================
+def _procesar_tramo(tramo):
+    salida = np.empty_like(tramo)
+    calcular(tramo, salida)
+    return salida
+
+
+def procesar_pickle(entrada, partes):
+    """Envía cada tramo al worker y recibe su resultado, ambos por pickle"""
+    trozos = [entrada[a:b] for a, b in tramos(len(entrada), partes)]
+    return np.concatenate(mapear(_procesar_tramo, trozos, chunksize=1))
+
+
+# =============================================================================
+# VARIANTE MEMORIA COMPARTIDA
+# =============================================================================
+def _adjuntar(nombre):
+    if sys.version_info >= (3, 13):
+        # The parent owns the segment; the worker must not track (and unlink) it
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    return shared_memory.SharedMemory(name=nombre)
+
+
+def _procesar_compartido(argumentos):
+    nombre_entrada, nombre_salida, n, inicio, fin = argumentos
+    shm_entrada, shm_salida = _adjuntar(nombre_entrada), _adjuntar(nombre_salida)
+    try:
+        entrada = np.ndarray((n,), dtype=TIPO, buffer=shm_entrada.buf)
+        salida = np.ndarray((n,), dtype=TIPO, buffer=shm_salida.buf)
+        calcular(entrada[inicio:fin], salida[inicio:fin])
+        # Drop the views before closing, or close() fails with exported buffers
+        del entrada, salida
+    finally:
+        shm_entrada.close()
+        shm_salida.close()
+
+
+class ArrayCompartido:
+    """Array de NumPy sobre un bloque de memoria compartida, liberado al salir del with"""
+
+    def __init__(self, n):
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, n * np.dtype(TIPO).itemsize))
+        self.array = np.ndarray((n,), dtype=TIPO, buffer=self.shm.buf)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        del self.array
+        self.shm.close()
+        self.shm.unlink()
+
+
+def procesar_compartido(entrada, salida, partes):
+    """Reparte los tramos de `entrada` entre los workers, que escriben en `salida`"""
+    n = len(entrada.array)
+    argumentos = [(entrada.shm.name, salida.shm.name, n, a, b) for a, b in tramos(n, partes)]
+    mapear(_procesar_compartido, argumentos, chunksize=1)
+    return argumentos
+
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+def bytes_pickle(objetos):
+    return sum(len(pickle.dumps(o, protocol=pickle.HIGHEST_PROTOCOL)) for o in objetos)
+
+
+def medir_pickle(n, partes, rng):
+    # The data is produced where it will be consumed, as in the shared variant
+    entrada = rng.random(n)
+    inicio = time.perf_counter()
+    resultado = procesar_pickle(entrada, partes)
+    segundos = time.perf_counter() - inicio
+    trozos = [entrada[a:b] for a, b in tramos(n, partes)]
+    enviados = bytes_pickle(trozos)
+    # Each worker returns an array of the same size as its chunk
+    recibidos = enviados
+    # np.concatenate copies every returned chunk once more in the parent
+    return segundos, enviados + recibidos, resultado.nbytes, resultado
+
+
+def medir_compartido(n, partes, rng):
+    with ArrayCompartido(n) as entrada, ArrayCompartido(n) as salida:
+        # The producer writes straight into shared memory: no copy to share it
+        rng.random(out=entrada.array)
+        inicio = time.perf_counter()
+        argumentos = procesar_compartido(entrada, salida, partes)
+        segundos = time.perf_counter() - inicio
+        # Only the tuples cross the pipe; workers return None
+        ipc = bytes_pickle(argumentos) + bytes_pickle([None] * len(argumentos))
+        resultado = salida.array.copy()
+    return segundos, ipc, 0, resultado
+
+
+def comparar(tamanos, repeticiones, partes):
+    calentar()
+    filas = []
+    for n in tamanos:
+        tiempos = {"pickle": [], "compartida": []}
+        for repeticion in range(repeticiones):
+            # Same input for both variants in each repetition
+            t_pickle, ipc_pickle, copia_pickle, r_pickle = medir_pickle(n, partes, np.random.default_rng(repeticion))
+            t_shm, ipc_shm, copia_shm, r_shm = medir_compartido(n, partes, np.random.default_rng(repeticion))
+            if not np.array_equal(r_pickle, r_shm):
+                raise AssertionError(f"Las variantes no coinciden para n={n}")
+            tiempos["pickle"].append(t_pickle)
+            tiempos["compartida"].append(t_shm)
+        filas.append({
+            "n": n,
+            "mb": n * np.dtype(TIPO).itemsize / 2**20,
+            "pickle_s": statistics.median(tiempos["pickle"]),
+            "compartida_s": statistics.median(tiempos["compartida"]),
+            "pickle_ipc_bytes": ipc_pickle,
+            "compartida_ipc_bytes": ipc_shm,
+            "pickle_copia_local_bytes": copia_pickle,
+            "compartida_copia_local_bytes": copia_shm,
+        })
+    return filas
+
+
+def imprimir(filas, partes):
+    print(f"\n{partes} tramos, mediana por variante (IPC = bytes serializados entre procesos)")
+    print(f"{'n':>12}{'MB':>9}{'pickle':>11}{'compartida':>12}{'speedup':>9}{'IPC pickle':>14}{'IPC compartida':>16}")
+    for f in filas:
+        print(
+            f"{f['n']:>12,}{f['mb']:>9.1f}{f['pickle_s'] * 1000:>9.1f}ms{f['compartida_s'] * 1000:>10.1f}ms"
+            f"{f['pickle_s'] / f['compartida_s']:>8.2f}x{f['pickle_ipc_bytes'] / 2**20:>11.1f} MB"
+            f"{f['compartida_ipc_bytes'] / 1024:>13.1f} KB"
+        )
+
+
+def modelo_5_memoria_compartida(n=5_000_000):
+    """Demo: la misma comparación para un solo tamaño"""
+    print(f"\n{'='*70}")
+    print("MODELO 5 (variante): PARALELO CON MEMORIA COMPARTIDA")
+    print(f"{'='*70}")
+    partes = cantidad_workers()
+    imprimir(comparar([n], 1, partes), partes)
+    print("(Una sola medición: para comparar tamaños usar memoria_compartida.py)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", default="100000,1000000,10000000",
+                        help="Cantidad de elementos float64, separados por coma")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--partes", type=int, help="Tramos en que se divide el array (default: un tramo por worker)")
+    parser.add_argument("--json", help="Archivo donde guardar los resultados")
+    args = parser.parse_args()
+
+    tamanos = [int(float(t)) for t in args.tamanos.split(",")]
+    partes = args.partes or cantidad_workers()
+    filas = comparar(tamanos, args.repeticiones, partes)
+    imprimir(filas, partes)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"partes": partes, "resultados": filas}, f, indent=2)
+        print(f"✅ JSON guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
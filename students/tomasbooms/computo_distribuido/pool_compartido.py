@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Pool de procesos compartido por las demos paralelas.
+
+Crear un ProcessPoolExecutor en cada demo paga el arranque y cierre de los
+procesos cada vez, y con tareas cortas ese costo tapa el speedup real. Este
+módulo mantiene un único pool que se crea la primera vez que se usa, se
+puede calentar antes de medir y se cierra al salir del programa.
+
+Uso:
+    from pool_compartido import calentar, mapear
+    calentar()                      # opcional: arranca todos los procesos ya
+    resultados = mapear(tarea_cpu, [10_000_000] * 4)
+
+    python pool_compartido.py       # reporta costo de arranque vs por tarea
+"""
+
+import atexit
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+
+_pool = None
+_workers = 0
+_caliente = False
+_lock = threading.Lock()
+
+
+def _nada(_=None):
+    """Tarea vacía: mide solo el costo de ida y vuelta al worker"""
+    return None
+
+
+def _pid(espera):
+    time.sleep(espera)
+    return os.getpid()
+
+
+def obtener_pool(max_workers=None):
+    """Devuelve el pool compartido, creándolo si todavía no existe."""
+    global _pool, _workers
+    with _lock:
+        if _pool is None:
+            if os.name == "posix":
+                # Workers must share the parent's resource tracker: one of
+                # their own would unlink shared memory they only attached to
+                # (memoria_compartida.py) when the worker exits
+                resource_tracker.ensure_running()
+            _workers = max_workers or os.cpu_count() or 1
+            _pool = ProcessPoolExecutor(max_workers=_workers)
+        return _pool
+
+
+def cantidad_workers():
+    """Procesos del pool compartido (lo crea si hace falta)"""
+    obtener_pool()
+    return _workers
+
+
+def calentar(max_workers=None):
+    """
+    Arranca todos los procesos del pool y devuelve los segundos que tardó
+    (0 si ya estaban arrancados). ProcessPoolExecutor crea los procesos a
+    demanda, así que sin esto el primer map mide también su arranque.
+    """
+    global _caliente
+    if _caliente:
+        return 0.0
+    inicio = time.perf_counter()
+    pool = obtener_pool(max_workers)
+    # Tasks submitted back to back find no idle worker, so each one spawns a
+    # process; the short sleep keeps them busy until all have started
+    pids = set()
+    while len(pids) < _workers:
+        pids.update(pool.map(_pid, [0.01] * _workers))
+    _caliente = True
+    return time.perf_counter() - inicio
+
+
+def mapear(funcion, *iterables, chunksize=None):
+    """
+    Como executor.map sobre el pool compartido, pero devuelve una lista y
+    agrupa las tareas en lotes: por defecto unos 4 lotes por worker, para
+    pagar el envío entre procesos una vez por lote y no por tarea.
+    """
+    argumentos = [list(i) for i in iterables]
+    pool = obtener_pool()
+    if chunksize is None:
+        total = min(len(a) for a in argumentos) if argumentos else 0
+        chunksize = max(1, math.ceil(total / (_workers * 4)))
+    try:
+        return list(pool.map(funcion, *argumentos, chunksize=chunksize))
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next call starts a fresh one
+        cerrar(esperar=False)
+        raise
+
+
+def cerrar(esperar=True):
+    """Cierra el pool compartido; el siguiente uso crea uno nuevo."""
+    global _pool, _workers, _caliente
+    with _lock:
+        pool, _pool, _workers, _caliente = _pool, None, 0, False
+    if pool is not None:
+        pool.shutdown(wait=esperar, cancel_futures=not esperar)
+
+
+atexit.register(cerrar)
+
+
+def costos(tareas=2000, max_workers=None):
+    """
+    Separa el costo de arrancar el pool del costo por tarea con el pool ya
+    caliente, enviando `tareas` tareas vacías de a una y en lotes.
+    """
+    cerrar()
+    arranque = calentar(max_workers)
+
+    inicio = time.perf_counter()
+    mapear(_nada, range(tareas), chunksize=1)
+    por_tarea = (time.perf_counter() - inicio) / tareas
+
+    inicio = time.perf_counter()
+    mapear(_nada, range(tareas))
+    por_tarea_lotes = (time.perf_counter() - inicio) / tareas
+
+    return {
+        "workers": _workers,
+        "arranque_s": arranque,
+        "por_tarea_us": por_tarea * 1e6,
+        "por_tarea_lotes_us": por_tarea_lotes * 1e6,
+    }
+
+
+def main():
+    resultado = costos()
+    print(f"Workers: {resultado['workers']}")
+    print(f"⏱️  Arranque del pool: {resultado['arranque_s'] * 1000:.1f}ms")
+    print(f"⏱️  Por tarea (de a una): {resultado['por_tarea_us']:.1f}µs")
+    print(f"⏱️  Por tarea (en lotes): {resultado['por_tarea_lotes_us']:.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
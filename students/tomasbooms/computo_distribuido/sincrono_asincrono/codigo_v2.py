@@ -9,13 +9,21 @@ Este archivo demuestra los diferentes modelos de ejecución explicados en:
 Cada ejemplo muestra un patrón diferente de ejecución.
 """
 
+import argparse
 import time
 import os
+import sys
 import asyncio
 import threading
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# pool_compartido.py and kernels.py live one directory up, next to
+# ejemplos_modelos_ejecucion.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from kernels import BACKENDS, backend_para_workers, suma_cuadrados
+from pool_compartido import calentar, mapear
+
 
 def tiempo():
     """Retorna timestamp legible: HH:MM:SS.mmm"""
@@ -132,31 +140,29 @@ def ejemplo_threading():
 # 5. PARALELO (Sección 6) - ProcessPoolExecutor
 # ============================================================================
 
-def tarea_cpu_intensiva(nombre, duracion=0.5):
+def tarea_cpu_intensiva(nombre, duracion=0.5, backend="python"):
     """Tarea CPU-bound para procesamiento paralelo"""
     print(f"[{tiempo()}] {nombre}: Inicio (PID: {os.getpid()})")
     # Simula trabajo intensivo
-    suma = sum(i**2 for i in range(100000))
+    suma = suma_cuadrados(100000, backend)
     time.sleep(duracion)
     print(f"[{tiempo()}] {nombre}: Fin (suma={suma})")
     return f"Resultado de {nombre}"
 
 
-def ejemplo_paralelo():
+def ejemplo_paralelo(backend="python"):
     """Paralelismo real: múltiples procesos en múltiples cores"""
     print("\n" + "="*60)
     print("5. PARALELO (ProcessPoolExecutor)")
     print("="*60)
     
-    # Usar ProcessPoolExecutor para trabajo CPU-bound
-    with ProcessPoolExecutor(max_workers=3) as executor:
-        futures = [
-            executor.submit(tarea_cpu_intensiva, "Tarea A", 0.5),
-            executor.submit(tarea_cpu_intensiva, "Tarea B", 0.5),
-            executor.submit(tarea_cpu_intensiva, "Tarea C", 0.5)
-        ]
-        
-        resultados = [f.result() for f in futures]
+    # Usar el pool de procesos compartido para trabajo CPU-bound
+    resultados = mapear(
+        tarea_cpu_intensiva,
+        ["Tarea A", "Tarea B", "Tarea C"],
+        [0.5, 0.5, 0.5],
+        [backend_para_workers(backend)] * 3
+    )
     
     print(f"Todas completadas. Resultados: {resultados}")
 
@@ -165,7 +171,15 @@ def ejemplo_paralelo():
 # 6. COMPARACIÓN: ThreadPoolExecutor vs ProcessPoolExecutor
 # ============================================================================
 
-def ejemplo_comparacion_executors():
+def tarea_cpu_pesada(nombre, backend="python"):
+    """Simula trabajo CPU intensivo (a nivel módulo para poder enviarla a otro proceso)"""
+    print(f"[{tiempo()}] {nombre}: Inicio CPU")
+    suma = suma_cuadrados(500000, backend)  # Cómputo pesado
+    print(f"[{tiempo()}] {nombre}: Fin CPU (suma={suma})")
+    return f"Resultado CPU de {nombre}"
+
+
+def ejemplo_comparacion_executors(backend="python"):
     """Compara ThreadPoolExecutor (I/O-bound) vs ProcessPoolExecutor (CPU-bound)"""
     print("\n" + "="*60)
     print("6. COMPARACIÓN: Threads vs Procesos")
@@ -178,22 +192,16 @@ def ejemplo_comparacion_executors():
         print(f"[{tiempo()}] {nombre}: Fin I/O")
         return f"Resultado I/O de {nombre}"
     
-    def tarea_cpu(nombre):
-        """Simula trabajo CPU intensivo"""
-        print(f"[{tiempo()}] {nombre}: Inicio CPU")
-        suma = sum(i**2 for i in range(500000))  # Cómputo pesado
-        print(f"[{tiempo()}] {nombre}: Fin CPU (suma={suma})")
-        return f"Resultado CPU de {nombre}"
-    
     print("\n--- ThreadPoolExecutor (I/O-bound) ---")
     with ThreadPoolExecutor(max_workers=3) as executor:
         futures = [executor.submit(tarea_io, f"Tarea {i}") for i in range(3)]
         resultados_threads = [f.result() for f in futures]
     
     print("\n--- ProcessPoolExecutor (CPU-bound) ---")
-    with ProcessPoolExecutor(max_workers=3) as executor:
-        futures = [executor.submit(tarea_cpu, f"Tarea {i}") for i in range(3)]
-        resultados_procesos = [f.result() for f in futures]
+    print(f"Arranque del pool: {calentar():.2f}s (0 si ya estaba arrancado)")
+    resultados_procesos = mapear(
+        tarea_cpu_pesada, [f"Tarea {i}" for i in range(3)], [backend_para_workers(backend)] * 3
+    )
     
     print(f"\nThreads: {resultados_threads}")
     print(f"Procesos: {resultados_procesos}")
@@ -205,6 +213,11 @@ def ejemplo_comparacion_executors():
 
 def main():
     """Ejecuta todos los ejemplos"""
+    parser = argparse.ArgumentParser(description="Ejemplos de modelos de ejecución")
+    parser.add_argument("--backend", choices=BACKENDS, default="python",
+                        help="Cómo calcular las sumas de las tareas CPU-bound (ver kernels.py)")
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("EJEMPLOS DE MODELOS DE EJECUCIÓN COMPUTACIONAL")
     print("="*60)
@@ -226,13 +239,13 @@ def main():
     # 5. Paralelo (multiprocessing)
     try:
         import os
-        ejemplo_paralelo()
+        ejemplo_paralelo(args.backend)
     except Exception as e:
         print(f"Error en ejemplo paralelo: {e}")
         print("(Puede requerir configuración especial en algunos sistemas)")
     
     # 6. Comparación
-    ejemplo_comparacion_executors()
+    ejemplo_comparacion_executors(args.backend)
     
     print("\n" + "="*60)
     print("FIN DE EJEMPLOS")
@@ -0,0 +1,154 @@
+"""
+Compresión de respuestas (brotli o gzip) según el header Accept-Encoding.
+
+brotli es opcional: si el paquete no está instalado solo se ofrece gzip.
+"""
+
+import zlib
+from typing import List, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Streams that must reach the client as soon as they are produced
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+            self._gz = None
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Flush on every chunk so streamed responses are not held back
+        if self._br is not None:
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._gz.flush()
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept) if accept else None
+        if encoding is None:
+            # Uncompressed responses still depend on Accept-Encoding: without
+            # Vary a cache could hand this body to a client that asked for gzip
+            async def send_vary(message):
+                if message["type"] == "http.response.start" and not _skip(message["headers"]):
+                    message = {**message, "headers": _add_vary(message["headers"])}
+                await send(message)
+
+            return await self.app(scope, receive, send_vary)
+
+        start_message = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Hold the headers until the first body chunk tells us the size
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                headers: List[tuple] = list(start["headers"])
+                if _skip(headers):
+                    passthrough = True
+                    await send(start)
+                    return await send(message)
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send({**start, "headers": _add_vary(headers)})
+                    return await send(message)
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers = [(k, v) for k, v in headers if k.lower() != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode()))
+                headers = _add_vary(headers)
+                if more_body:
+                    data = compressor.chunk(body)
+                else:
+                    data = compressor.chunk(body) + compressor.finish()
+                    headers.append((b"content-length", str(len(data)).encode()))
+                await send({**start, "headers": headers})
+                return await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+            if passthrough:
+                return await send(message)
+            data = compressor.chunk(body)
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _skip(headers: List[tuple]) -> bool:
+    for name, value in headers:
+        name = name.lower()
+        if name == b"content-encoding":
+            return True
+        if name == b"content-type" and value.decode("latin-1").startswith(UNCOMPRESSED_MEDIA_TYPES):
+            return True
+    return False
+
+
+def _add_vary(headers: List[tuple]) -> List[tuple]:
+    headers = list(headers)
+    for position, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            # Merge with what other middlewares put there (CORS adds Origin)
+            if value.strip() != b"*" and b"accept-encoding" not in value.lower():
+                headers[position] = (name, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
@@ -0,0 +1,197 @@
+"""
+Feed en vivo de cambios en `items` para los clientes SSE y WebSocket.
+
+Cada worker tiene un solo lector de MongoDB (un change stream o, si el
+servidor no los soporta, una consulta periódica sobre `created_at`) y reparte
+cada evento a todos sus suscriptores. Cada suscriptor tiene un buffer acotado:
+si no consume a tiempo se lo desconecta para que no frene a los demás.
+"""
+
+import asyncio
+import contextvars
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+import orjson
+from bson import ObjectId
+from pymongo.errors import OperationFailure
+
+from metrics import counter, gauge
+from queries import ITEM_PROJECTION, after_condition, sort_spec
+
+feed_subscribers = gauge("feed_subscribers", "Clientes suscritos al feed de items")
+feed_events = counter("feed_events_total", "Eventos del feed repartidos a los suscriptores", ["op"])
+feed_lagged = counter("feed_lagged_total", "Suscriptores desconectados por no consumir a tiempo")
+feed_upstream_errors = counter("feed_upstream_errors_total", "Errores leyendo cambios de MongoDB", ["source"])
+
+# Same shape as ITEM_PROJECTION, for documents that come from a change stream
+ITEM_FIELDS = ("name", "description", "price", "created_at", "updated_at")
+POLL_BATCH = 500
+RETRY_DELAY = 1.0
+
+
+class FeedEvent(NamedTuple):
+    op: str
+    data: bytes
+    # The SSE frame is encoded once here instead of once per client
+    sse: bytes
+
+
+class SubscriptionClosed(Exception):
+    pass
+
+
+class Subscription:
+    def __init__(self, buffer_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.closed: Optional[str] = None
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[FeedEvent]:
+        """Siguiente evento, o None si no llegó ninguno en `timeout` segundos."""
+        if self.closed is not None and self.queue.empty():
+            raise SubscriptionClosed(self.closed)
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is None:
+            raise SubscriptionClosed(self.closed)
+        return event
+
+    def close(self, reason: str):
+        self.closed = reason
+        try:
+            # Wakes a reader blocked on an empty queue; a full queue needs no wake-up
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+def _item(doc: Dict[str, Any]) -> Dict[str, Any]:
+    item = {"id": str(doc["_id"])}
+    for field in ITEM_FIELDS:
+        item[field] = doc.get(field)
+    return item
+
+
+class ItemFeed:
+    def __init__(self, collection, mode: str = "auto", poll_interval: float = 1.0, buffer_size: int = 256):
+        self.collection = collection
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.buffer_size = buffer_size
+        self.source: Optional[str] = None
+        self.subscribers: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._resume_token = None
+        self._last: Optional[Tuple[Any, ObjectId]] = None
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.buffer_size)
+        self.subscribers.add(subscription)
+        feed_subscribers.set(len(self.subscribers))
+        if self._task is None or self._task.done():
+            # Fresh context so the reader does not inherit the request's metrics state
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscribers.discard(subscription)
+        feed_subscribers.set(len(self.subscribers))
+        if not self.subscribers and self._task is not None:
+            # Nobody is listening: stop reading from Mongo until the next client
+            self._task.cancel()
+            self._task = None
+            self._resume_token = None
+            self._last = None
+
+    def publish(self, op: str, item_id: str, item: Optional[Dict[str, Any]] = None):
+        data = orjson.dumps({"op": op, "id": item_id, "item": item})
+        event = FeedEvent(op, data, b"event: " + op.encode() + b"\ndata: " + data + b"\n\n")
+        feed_events.labels(op).inc()
+        for subscription in list(self.subscribers):
+            if subscription.closed is not None:
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.close("lagged")
+                feed_lagged.inc()
+
+    def stats(self) -> dict:
+        return {"source": self.source, "subscribers": len(self.subscribers)}
+
+    async def stop(self):
+        for subscription in list(self.subscribers):
+            subscription.close("shutdown")
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        use_stream = self.mode in ("auto", "change_stream")
+        while True:
+            source = "change_stream" if use_stream else "poll"
+            try:
+                if use_stream:
+                    await self._watch()
+                else:
+                    await self._poll()
+            except OperationFailure as e:
+                feed_upstream_errors.labels(source).inc()
+                if use_stream and self.mode == "auto":
+                    # Standalone servers reject $changeStream; fall back for good
+                    print(f"ℹ️ Change streams no disponibles ({e}); el feed consulta por created_at")
+                    use_stream = False
+                    continue
+                print(f"❌ Error en el feed de items: {e}")
+            except Exception as e:
+                feed_upstream_errors.labels(source).inc()
+                print(f"❌ Error en el feed de items: {e}")
+            await asyncio.sleep(RETRY_DELAY)
+
+    async def _watch(self):
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+        async with self.collection.watch(
+            pipeline, full_document="updateLookup", resume_after=self._resume_token
+        ) as stream:
+            self.source = "change_stream"
+            async for change in stream:
+                self._resume_token = stream.resume_token
+                op = change["operationType"]
+                item_id = str(change["documentKey"]["_id"])
+                if op == "delete":
+                    self.publish("delete", item_id)
+                    continue
+                doc = change.get("fullDocument")
+                if doc is None:
+                    # Deleted before the update lookup ran; the delete event follows
+                    continue
+                self.publish("insert" if op == "insert" else "update", item_id, _item(doc))
+
+    async def _poll(self):
+        # Polling only sees inserts, and only those whose created_at is not
+        # older than the newest one already seen
+        if self._last is None:
+            latest = await self.collection.find_one(
+                {"created_at": {"$ne": None}}, {"created_at": 1}, sort=list(sort_spec("-created_at").items())
+            )
+            self._last = (latest["created_at"], latest["_id"]) if latest else None
+        self.source = "poll"
+        while True:
+            query = after_condition("created_at", *self._last) if self._last else {"created_at": {"$ne": None}}
+            pipeline = [
+                {"$match": query},
+                {"$sort": sort_spec("created_at")},
+                {"$limit": POLL_BATCH},
+                {"$project": ITEM_PROJECTION},
+            ]
+            items = await self.collection.aggregate(pipeline).to_list(length=POLL_BATCH)
+            for item in items:
+                self.publish("insert", item["id"], item)
+                self._last = (item["created_at"], ObjectId(item["id"]))
+            if len(items) < POLL_BATCH:
+                await asyncio.sleep(self.poll_interval)
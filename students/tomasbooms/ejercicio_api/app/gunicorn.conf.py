@@ -0,0 +1,29 @@
+# Production server profile: gunicorn manages N uvicorn workers (one event
+# loop per core) and recycles them gracefully. Development keeps using
+# `uvicorn --reload` (see the fastapi-dev service in docker-compose.yml).
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# One worker per core: each worker is a single-threaded event loop
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+worker_class = "worker.UvloopWorker"
+
+# Restart each worker after a number of requests (with jitter, so they do
+# not all restart at once) to bound memory growth; in-flight requests get
+# graceful_timeout seconds to finish
+max_requests = int(os.getenv("MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "1000"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = 5
+
+# Importing the app opens no connections (each worker creates its Motor
+# client in the lifespan), so preloading would be safe. The app is still
+# imported in each worker so a HUP reload or a worker recycled by
+# max_requests runs the current code, not the master's copy
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
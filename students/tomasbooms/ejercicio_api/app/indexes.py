@@ -0,0 +1,80 @@
+from typing import Any, Dict, List, Optional
+
+from pymongo import ASCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from settings import settings
+
+# The compound indexes end in _id so keyset pagination sorted by that field
+# can break ties without an in-memory sort. Their prefix also serves plain
+# filters and sorts on created_at / price, so no single-field copies are kept.
+ITEM_INDEXES: List[IndexModel] = [
+    IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)], name="created_at_id"),
+    IndexModel([("price", ASCENDING), ("_id", ASCENDING)], name="price_id"),
+    # Anchored prefix searches (name_prefix) become a range scan on this index
+    IndexModel([("name", ASCENDING), ("_id", ASCENDING)], name="name_id"),
+]
+ITEM_TEXT_INDEX = IndexModel(
+    [("name", TEXT), ("description", TEXT)],
+    name="name_description_text",
+    weights={"name": 2, "description": 1},
+    default_language="spanish",
+)
+
+
+def item_indexes() -> List[IndexModel]:
+    return ITEM_INDEXES + ([ITEM_TEXT_INDEX] if settings.items_text_index else [])
+
+
+async def ensure_indexes(collection) -> List[str]:
+    """Crea los índices de `items`. Es idempotente: los que ya existen no se tocan."""
+    try:
+        return await collection.create_indexes(item_indexes())
+    except OperationFailure as e:
+        # An index with the same name but different options already exists;
+        # keep serving with what is there instead of failing startup
+        print(f"⚠️  No se pudieron crear los índices: {e}")
+        return []
+
+
+def _find_winning_plan(node: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(node, dict):
+        if "winningPlan" in node:
+            return node["winningPlan"]
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        plan = _find_winning_plan(child)
+        if plan is not None:
+            return plan
+    return None
+
+
+def summarize_plan(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce la salida de `explain` a las etapas del plan ganador y los índices usados."""
+    plan = _find_winning_plan(explain)
+    # Newer servers wrap the classic plan as {"queryPlan": ..., "slotBasedPlan": ...}
+    if plan is not None and "queryPlan" in plan:
+        plan = plan["queryPlan"]
+
+    stages: List[str] = []
+    indexes: List[str] = []
+    pending = [plan] if plan else []
+    while pending:
+        stage = pending.pop(0)
+        stages.append(stage.get("stage", "?"))
+        if "indexName" in stage:
+            indexes.append(stage["indexName"])
+        if "inputStage" in stage:
+            pending.append(stage["inputStage"])
+        pending.extend(stage.get("inputStages", []))
+
+    return {
+        "stages": stages,
+        "indexes": indexes,
+        "collection_scan": "COLLSCAN" in stages,
+        "winning_plan": plan,
+    }
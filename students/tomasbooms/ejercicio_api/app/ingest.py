@@ -0,0 +1,171 @@
+"""
+Ingesta con escritura diferida para POST /items.
+
+Las peticiones encolan el documento en memoria y una tarea de fondo los
+escribe agrupados con `insert_many` cuando se junta un lote o vence el plazo
+(group commit). La cola es acotada: si está llena la inserción se rechaza en
+lugar de acumular memoria sin límite.
+"""
+
+import asyncio
+import contextvars
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from metrics import counter, gauge, histogram
+
+BATCH_BUCKETS = (1, 10, 50, 100, 250, 500, 1000, 5000)
+
+ingest_queue_depth = gauge("ingest_queue_depth", "Items encolados pendientes de escribir")
+ingest_batch_size = histogram("ingest_batch_size", "Items escritos por cada insert_many", buckets=BATCH_BUCKETS)
+ingest_flush_seconds = histogram("ingest_flush_seconds", "Duración de cada insert_many de la cola")
+ingest_items = counter("ingest_items_total", "Items procesados por la cola de ingesta", ["result"])
+
+PENDING = "pending"
+INSERTED = "inserted"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    pass
+
+
+class IngestError(Exception):
+    pass
+
+
+class IngestWriter:
+    def __init__(
+        self,
+        collection,
+        max_batch: int = 500,
+        max_delay: float = 0.01,
+        max_queue: int = 10000,
+        status_size: int = 100000,
+        on_flush: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+    ):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.on_flush = on_flush
+        self.status_size = status_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._max_queue = max_queue
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        # Outcome of recent items for the 202 status URL, oldest dropped first
+        self._status: "OrderedDict[str, Tuple[str, Optional[str]]]" = OrderedDict()
+
+    def _ensure_started(self):
+        # Created lazily so the queue and task belong to the worker's running loop
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._batch_ready = asyncio.Event()
+        if self._task is None or self._task.done():
+            # Fresh context: the task must not inherit the per-request metrics
+            # state of whichever request happened to start it
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    def submit(self, doc: dict) -> asyncio.Future:
+        """Encola un documento con `_id` ya asignado; el future se resuelve cuando se escribe."""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((doc, future))
+        except asyncio.QueueFull:
+            ingest_items.labels("rejected").inc()
+            raise QueueFull()
+        self._set_status(str(doc["_id"]), PENDING)
+        ingest_queue_depth.set(self._queue.qsize())
+        if self._queue.qsize() >= self.max_batch:
+            self._batch_ready.set()
+        return future
+
+    def status(self, item_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        return self._status.get(item_id)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self._max_queue,
+            "max_batch": self.max_batch,
+            "max_delay": self.max_delay,
+        }
+
+    async def stop(self):
+        """Escribe lo que quede en la cola y detiene la tarea de fondo."""
+        if self._task is None:
+            return
+        self._batch_ready.set()
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            first = await self._queue.get()
+            if self._queue.qsize() + 1 < self.max_batch:
+                # Give the burst a moment to fill the batch; submit() wakes us early
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_ready.clear()
+            batch = [first]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            ingest_queue_depth.set(self._queue.qsize())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[dict, asyncio.Future]]):
+        docs = [doc for doc, _ in batch]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+            failed = {}
+        except BulkWriteError as e:
+            failed = {err["index"]: err.get("errmsg", "") for err in e.details.get("writeErrors", [])}
+        except Exception as e:
+            failed = {index: str(e) for index in range(len(docs))}
+        ingest_flush_seconds.observe(loop.time() - start)
+        ingest_batch_size.observe(len(docs))
+
+        inserted = []
+        for index, (doc, future) in enumerate(batch):
+            item_id = str(doc["_id"])
+            if index in failed:
+                self._set_status(item_id, FAILED, failed[index])
+                if not future.done():
+                    future.set_exception(IngestError(failed[index]))
+                    # Async-mode callers never await the future
+                    future.exception()
+            else:
+                inserted.append(item_id)
+                self._set_status(item_id, INSERTED)
+                if not future.done():
+                    future.set_result(item_id)
+        ingest_items.labels("inserted").inc(len(inserted))
+        ingest_items.labels("failed").inc(len(failed))
+
+        if inserted and self.on_flush is not None:
+            try:
+                await self.on_flush(inserted)
+            except Exception as e:
+                print(f"❌ Error tras escribir un lote de ingesta: {e}")
+
+    def _set_status(self, item_id: str, status: str, error: Optional[str] = None):
+        self._status[item_id] = (status, error)
+        self._status.move_to_end(item_id)
+        while len(self._status) > self.status_size:
+            self._status.popitem(last=False)
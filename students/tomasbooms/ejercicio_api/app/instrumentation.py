@@ -0,0 +1,84 @@
+"""
+Instrumentación por ruta de la API: conteo de peticiones, latencia, tamaño de
+respuesta, peticiones en vuelo y tiempo esperando a MongoDB vs tiempo en Python.
+"""
+
+import contextvars
+import time
+from typing import Awaitable, List, TypeVar
+
+from metrics import counter, gauge, histogram
+
+T = TypeVar("T")
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+http_requests = counter("http_requests_total", "Peticiones HTTP atendidas", ["method", "route", "status"])
+http_duration = histogram("http_request_duration_seconds", "Latencia total de la petición", ["method", "route"])
+http_db_time = histogram("http_request_db_seconds", "Tiempo de la petición esperando a MongoDB", ["method", "route"])
+http_python_time = histogram(
+    "http_request_python_seconds", "Tiempo de la petición fuera de MongoDB (Python, red, serialización)", ["method", "route"]
+)
+http_response_size = histogram(
+    "http_response_size_bytes", "Tamaño del cuerpo de la respuesta", ["method", "route"], buckets=SIZE_BUCKETS
+)
+http_in_flight = gauge("http_requests_in_flight", "Peticiones HTTP en curso")
+
+# Seconds spent awaiting Mongo in the current request. A one-element list so
+# tasks spawned by the request (streaming bodies) add to the same total.
+_db_seconds: contextvars.ContextVar[List[float]] = contextvars.ContextVar("db_seconds")
+
+
+async def timed_db(awaitable: Awaitable[T]) -> T:
+    """Espera una operación de MongoDB sumando su duración al tiempo de base de datos de la petición."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        acc = _db_seconds.get(None)
+        if acc is not None:
+            acc[0] += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    """Middleware ASGI puro (sin BaseHTTPMiddleware) para que el costo por petición sea mínimo."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        db_seconds = [0.0]
+        token = _db_seconds.set(db_seconds)
+        http_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight.dec()
+            _db_seconds.reset(token)
+
+            # The router stores the matched route in the scope; use its path
+            # template so /items/{item_id} is one series, not one per id
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_requests.labels(method, path, status).inc()
+            http_duration.labels(method, path).observe(elapsed)
+            http_db_time.labels(method, path).observe(db_seconds[0])
+            http_python_time.labels(method, path).observe(max(0.0, elapsed - db_seconds[0]))
+            http_response_size.labels(method, path).observe(size)
@@ -0,0 +1,264 @@
+"""
+Métricas en memoria con salida en formato de texto de Prometheus.
+
+Los contadores se actualizan desde el event loop y también desde los hilos
+donde Motor ejecuta pymongo (los listeners de pymongo corren ahí), por eso
+cada métrica protege sus valores con un lock.
+"""
+
+import abc
+import math
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from pymongo import monitoring
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric(abc.ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abc.abstractmethod
+    def _new_child(self):
+        """Crea el valor de una combinación de etiquetas."""
+
+    @abc.abstractmethod
+    def _samples(self) -> List[str]:
+        """Líneas de muestras en formato Prometheus."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def _new_child(self):
+        return _Value(self._lock)
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+            for key, child in sorted(self._children.items())
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, amount: float = 1):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float):
+        with self._lock:
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets, self._lock)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, child in sorted(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, child.counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            inf = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {child.count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# MongoDB connection pool
+pool_checkout_wait = histogram(
+    "mongodb_pool_checkout_wait_seconds",
+    "Tiempo esperando una conexión libre del pool",
+    ["address"],
+)
+pool_checkout_failures = counter(
+    "mongodb_pool_checkout_failures_total",
+    "Intentos de obtener una conexión que fallaron",
+    ["address", "reason"],
+)
+pool_connections = gauge("mongodb_pool_connections", "Conexiones abiertas en el pool", ["address"])
+pool_checkout_waiting = gauge("mongodb_pool_checkout_waiting", "Operaciones esperando una conexión", ["address"])
+pool_connections_in_use = gauge("mongodb_pool_connections_in_use", "Conexiones prestadas a una operación", ["address"])
+pool_cleared = counter("mongodb_pool_cleared_total", "Veces que el pool se vació por un error", ["address"])
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Traduce los eventos del pool de pymongo a métricas."""
+
+    def __init__(self):
+        # Checkout start and end happen on the same thread, so a thread-local
+        # start time is enough to measure the wait
+        self._local = threading.local()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pool_cleared.labels(_address(event)).inc()
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pool_connections.labels(_address(event)).inc()
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pool_connections.labels(_address(event)).dec()
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+        pool_checkout_waiting.labels(_address(event)).inc()
+
+    def connection_check_out_failed(self, event):
+        address = _address(event)
+        self._observe_wait(address)
+        pool_checkout_failures.labels(address, event.reason).inc()
+
+    def connection_checked_out(self, event):
+        address = _address(event)
+        self._observe_wait(address)
+        pool_connections_in_use.labels(address).inc()
+
+    def connection_checked_in(self, event):
+        pool_connections_in_use.labels(_address(event)).dec()
+
+    def _observe_wait(self, address: str):
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            pool_checkout_wait.labels(address).observe(time.perf_counter() - started)
+            pool_checkout_waiting.labels(address).dec()
+            self._local.started = None
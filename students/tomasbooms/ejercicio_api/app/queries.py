@@ -0,0 +1,181 @@
+import base64
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import bson
+from bson import ObjectId
+
+# Shape ItemResponse documents inside Mongo (including the _id -> id rename)
+# so the read path can encode them straight to JSON without building models.
+ITEM_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "name": 1,
+    "description": {"$ifNull": ["$description", None]},
+    "price": 1,
+    "created_at": {"$ifNull": ["$created_at", None]},
+    "updated_at": {"$ifNull": ["$updated_at", None]},
+}
+
+# Sort keys accepted by GET /items; a leading "-" means descending
+SORT_PATTERN = "^-?(_id|created_at|price)$"
+
+# GET /items/stats: default price histogram boundaries and $dateTrunc units
+PRICE_BUCKETS = (0, 10, 50, 100, 500, 1000)
+STATS_WINDOW_PATTERN = "^(hour|day|week|month)$"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _range(lower: Any, upper: Any, upper_op: str = "$lte") -> Dict[str, Any]:
+    bounds: Dict[str, Any] = {}
+    if lower is not None:
+        bounds["$gte"] = lower
+    if upper is not None:
+        bounds[upper_op] = upper
+    return bounds
+
+
+@dataclass
+class ItemFilters:
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    name_prefix: Optional[str] = None
+    q: Optional[str] = None
+
+    def to_query(self) -> Dict[str, Any]:
+        """Compila los filtros en un solo documento de consulta resoluble con índices."""
+        query: Dict[str, Any] = {}
+        price = _range(self.min_price, self.max_price)
+        if price:
+            query["price"] = price
+        created_at = _range(self.created_after, self.created_before, upper_op="$lt")
+        if created_at:
+            query["created_at"] = created_at
+        if self.name_prefix:
+            # An anchored, case-sensitive prefix regex becomes an index range scan
+            query["name"] = {"$regex": "^" + re.escape(self.name_prefix)}
+        if self.q:
+            query["$text"] = {"$search": self.q}
+        return query
+
+
+def parse_sort(sort: str) -> Tuple[str, int]:
+    return (sort[1:], -1) if sort.startswith("-") else (sort, 1)
+
+
+def sort_spec(sort: str) -> Dict[str, int]:
+    field, direction = parse_sort(sort)
+    # _id breaks ties so the order is total and matches the compound indexes
+    return {field: direction} if field == "_id" else {field: direction, "_id": direction}
+
+
+def encode_cursor(sort: str, last: Dict[str, Any]) -> str:
+    field, _ = parse_sort(sort)
+    payload = {"s": sort, "i": ObjectId(last["id"])}
+    if field != "_id":
+        payload["v"] = last[field]
+    return base64.urlsafe_b64encode(bson.encode(payload)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Dict[str, Any]:
+    """Convierte un cursor en la condición que selecciona los documentos posteriores a él."""
+    try:
+        payload = bson.decode(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        last_id = payload["i"]
+        if payload["s"] != sort or not isinstance(last_id, ObjectId):
+            raise InvalidCursor("El cursor pertenece a otro orden")
+    except InvalidCursor:
+        raise
+    except Exception as e:
+        raise InvalidCursor(str(e))
+
+    return after_condition(sort, payload.get("v"), last_id)
+
+
+def after_condition(sort: str, value: Any, last_id: ObjectId) -> Dict[str, Any]:
+    """Condición que selecciona los documentos posteriores a (value, last_id) en el orden dado."""
+    field, direction = parse_sort(sort)
+    op = "$gt" if direction == 1 else "$lt"
+    if field == "_id":
+        return {"_id": {op: last_id}}
+    return {"$or": [{field: {op: value}}, {field: value, "_id": {op: last_id}}]}
+
+
+def _match(*conditions: Dict[str, Any]) -> Dict[str, Any]:
+    conditions = [c for c in conditions if c]
+    if len(conditions) <= 1:
+        return conditions[0] if conditions else {}
+    return {"$and": conditions}
+
+
+def offset_pipeline(filters: ItemFilters, sort: Optional[str], skip: int, limit: int) -> List[dict]:
+    pipeline: List[dict] = []
+    query = filters.to_query()
+    if query:
+        pipeline.append({"$match": query})
+    if sort:
+        pipeline.append({"$sort": sort_spec(sort)})
+    pipeline += [{"$skip": skip}, {"$limit": limit}, {"$project": ITEM_PROJECTION}]
+    return pipeline
+
+
+def keyset_pipeline(filters: ItemFilters, sort: str, after: Optional[Dict[str, Any]], limit: int) -> List[dict]:
+    return [
+        {"$match": _match(filters.to_query(), after or {})},
+        {"$sort": sort_spec(sort)},
+        {"$limit": limit},
+        {"$project": ITEM_PROJECTION},
+    ]
+
+
+def item_pipeline(oid: ObjectId) -> List[dict]:
+    return [{"$match": {"_id": oid}}, {"$project": ITEM_PROJECTION}]
+
+
+def _summary(key: Any) -> dict:
+    return {
+        "$group": {
+            "_id": key,
+            "count": {"$sum": 1},
+            "sum": {"$sum": "$price"},
+            "mean": {"$avg": "$price"},
+            "min": {"$min": "$price"},
+            "max": {"$max": "$price"},
+        }
+    }
+
+
+def stats_pipeline(filters: ItemFilters, boundaries: Sequence[float], window: Optional[str]) -> List[dict]:
+    """Totales, histograma de precios y, opcionalmente, totales por ventana de `created_at` en una sola pasada."""
+    facets = {
+        "summary": [_summary(None)],
+        "price_buckets": [
+            {
+                "$bucket": {
+                    "groupBy": "$price",
+                    "boundaries": list(boundaries),
+                    "default": "outside",
+                    "output": {"count": {"$sum": 1}},
+                }
+            }
+        ],
+    }
+    if window:
+        facets["windows"] = [
+            {"$match": {"created_at": {"$ne": None}}},
+            _summary({"$dateTrunc": {"date": "$created_at", "unit": window}}),
+            {"$sort": {"_id": 1}},
+        ]
+    pipeline: List[dict] = []
+    query = filters.to_query()
+    if query:
+        pipeline.append({"$match": query})
+    pipeline.append({"$facet": facets})
+    return pipeline
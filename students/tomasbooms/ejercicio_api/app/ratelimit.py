@@ -0,0 +1,150 @@
+"""
+Control de admisión: límite de peticiones por cliente (token bucket) y tope
+global de peticiones en curso por worker.
+
+El cliente se identifica por el header `X-API-Key` si es una de las claves
+configuradas y, si no, por su IP. Los buckets viven en memoria del worker (`MemoryBackend`); para
+compartirlos entre workers o instancias se puede indicar otro backend con
+`RATE_LIMIT_BACKEND=modulo:Clase`, cualquier clase con el mismo método `take`.
+"""
+
+import importlib
+import math
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import orjson
+
+from metrics import counter, gauge
+
+requests_shed = counter("http_requests_shed_total", "Peticiones rechazadas por el control de admisión", ["reason"])
+admitted_in_flight = gauge("http_requests_admitted_in_flight", "Peticiones admitidas que cuentan para el tope global")
+
+
+class MemoryBackend:
+    """Token buckets en memoria, acotados a `max_keys` clientes (se descartan los menos recientes)."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Consume un token de `key`. Devuelve 0 si había, o los segundos hasta que haya uno."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+def load_backend(spec: str):
+    if spec == "memory":
+        return MemoryBackend()
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)()
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self,
+        app,
+        backend,
+        rate: float,
+        burst: int,
+        max_in_flight: int,
+        exempt_paths: Iterable[str] = (),
+        long_lived_paths: Iterable[str] = (),
+        trust_forwarded: bool = False,
+        api_keys: Iterable[str] = (),
+    ):
+        self.app = app
+        self.backend = backend
+        # rate <= 0 or max_in_flight <= 0 turns the corresponding check off
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        # Probes and metrics must answer even when the API is shedding load
+        self.exempt_paths = frozenset(exempt_paths)
+        # Streams and WebSockets hold their connection open for minutes: they
+        # are rate limited when they connect but do not count against the
+        # in-flight cap, which would otherwise fill up with idle listeners
+        self.long_lived_paths = frozenset(long_lived_paths)
+        self.trust_forwarded = trust_forwarded
+        self.api_keys = frozenset(api_keys)
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket") or scope["path"] in self.exempt_paths:
+            return await self.app(scope, receive, send)
+
+        counted = (
+            self.max_in_flight > 0 and scope["type"] == "http" and scope["path"] not in self.long_lived_paths
+        )
+        if counted and self.in_flight >= self.max_in_flight:
+            requests_shed.labels("overloaded").inc()
+            return await _reject(scope, send, 503, "Servidor saturado, reintenta más tarde", 1)
+
+        if self.rate > 0:
+            wait = await self.backend.take(self._client_key(scope), self.rate, self.burst)
+            if wait > 0:
+                requests_shed.labels("rate_limited").inc()
+                return await _reject(scope, send, 429, "Demasiadas peticiones", wait)
+
+        if not counted:
+            return await self.app(scope, receive, send)
+        self.in_flight += 1
+        admitted_in_flight.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            admitted_in_flight.dec()
+
+    def _client_key(self, scope) -> str:
+        api_key: Optional[str] = None
+        forwarded = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value.decode("latin-1")
+            elif name == b"x-forwarded-for":
+                forwarded = value
+        # Only configured keys get a bucket of their own: otherwise a client
+        # could send a new key on every request and never run out of tokens
+        if api_key is not None and api_key in self.api_keys:
+            return "key:" + api_key
+        if self.trust_forwarded and forwarded:
+            return "ip:" + forwarded.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+
+async def _reject(scope, send, status: int, detail: str, retry_after: float):
+    body = orjson.dumps({"detail": detail})
+    prefix = "http."
+    if scope["type"] == "websocket":
+        if "websocket.http.response" not in scope.get("extensions", {}):
+            # Without the denial response extension the handshake can only be
+            # refused; 1013 is "try again later"
+            return await send({"type": "websocket.close", "code": 1013, "reason": detail})
+        prefix = "websocket.http."
+    await send(
+        {
+            "type": prefix + "response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        }
+    )
+    await send({"type": prefix + "response.body", "body": body})
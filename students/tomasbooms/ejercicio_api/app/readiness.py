@@ -0,0 +1,86 @@
+"""
+Estado de preparación de la API para `/readyz`.
+
+Una tarea de fondo hace ping a MongoDB cada `interval` segundos y guarda el
+resultado; `/readyz` solo lee ese resultado, así que los probes frecuentes
+de un orquestador no generan tráfico a la base de datos.
+"""
+
+import asyncio
+import contextvars
+import time
+from typing import Awaitable, Callable, Optional
+
+from metrics import gauge
+
+app_ready_seconds = gauge("app_ready_seconds", "Segundos desde el arranque hasta estar listo por primera vez")
+database_up = gauge("mongodb_up", "1 si el último ping a MongoDB respondió")
+
+
+class ReadinessProbe:
+    def __init__(self, interval: float = 5, timeout: float = 2):
+        self.interval = interval
+        self.timeout = timeout
+        # Set once the startup work that needs the database (indexes) is done
+        self.started = False
+        self.ok = False
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self._ping: Optional[Callable[[], Awaitable]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._boot = time.monotonic()
+
+    def start(self, ping: Callable[[], Awaitable]):
+        self._ping = ping
+        self._boot = time.monotonic()
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def mark_started(self):
+        self.started = True
+        self._record_ready()
+
+    async def check(self):
+        try:
+            # Not wait_for: on 3.11 it swallows stop()'s cancel if the ping
+            # finishes at the same moment, and the loop never exits
+            async with asyncio.timeout(self.timeout):
+                await self._ping()
+            self.ok, self.error = True, None
+        except Exception as e:
+            self.ok, self.error = False, str(e) or type(e).__name__
+        self.checked_at = time.monotonic()
+        database_up.set(1 if self.ok else 0)
+        self._record_ready()
+
+    @property
+    def ready(self) -> bool:
+        # A result older than a few intervals means the checker itself is stuck
+        fresh = self.checked_at is not None and time.monotonic() - self.checked_at < 3 * self.interval
+        return self.started and self.ok and fresh
+
+    def status(self) -> dict:
+        return {
+            "status": "ready" if self.ready else "not_ready",
+            "started": self.started,
+            "database": "connected" if self.ok else "unavailable",
+            "error": self.error,
+            "checked_seconds_ago": None if self.checked_at is None else time.monotonic() - self.checked_at,
+        }
+
+    async def _run(self):
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def _record_ready(self):
+        if self.ready and not app_ready_seconds.labels().value:
+            app_ready_seconds.set(time.monotonic() - self._boot)
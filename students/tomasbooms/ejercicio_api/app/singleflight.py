@@ -0,0 +1,60 @@
+"""
+Coalescencia de lecturas idénticas concurrentes (single-flight).
+
+Mientras una lectura está en curso, las peticiones con la misma clave
+esperan su resultado en lugar de lanzar otra consulta a MongoDB. El
+resultado no se guarda: en cuanto la lectura termina, la siguiente petición
+vuelve a consultar (para reutilizar resultados está la caché).
+"""
+
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from metrics import counter
+
+T = TypeVar("T")
+
+singleflight_requests = counter(
+    "singleflight_requests_total",
+    "Lecturas que lanzaron la consulta (leader) o esperaron una igual en curso (coalesced)",
+    ["name", "result"],
+)
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._leader = singleflight_requests.labels(name, "leader")
+        self._coalesced = singleflight_requests.labels(name, "coalesced")
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Ejecuta `fn` o se une a la ejecución en curso con la misma `key`. La
+        clave debe cambiar cuando cambian los datos (p. ej. incluir una
+        versión), o una petición posterior a una escritura podría unirse a una
+        lectura que empezó antes.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self._leader.inc()
+            # A task of its own, so a caller that disconnects does not cancel
+            # the read the others are waiting on; it is shared, so it does not
+            # inherit the first caller's request context either
+            task = asyncio.create_task(fn(), context=contextvars.Context())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self._coalesced.inc()
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Retrieve the exception so it is not logged when every caller left
+            task.exception()
@@ -0,0 +1,101 @@
+import asyncio
+import contextvars
+from typing import Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+
+
+class CollectionVersion:
+    """
+    Contador de cambios de una colección para usar como ETag sin consultar
+    MongoDB en cada petición.
+
+    El contador compartido vive en MongoDB para que todos los workers lo vean,
+    pero ni las lecturas ni las escrituras lo esperan: una tarea de fondo lo
+    incrementa después de las escrituras de este worker y lo relee cada
+    `refresh_interval` segundos para enterarse de las de los demás. Mientras
+    una escritura local no llegó a MongoDB, la versión lleva un sufijo propio
+    del worker, así que cambia en el acto para quien escribió.
+
+    El `epoch` se genera al crear el contador, así que si el documento se
+    borra y el contador vuelve a empezar, los ETags anteriores no coinciden.
+    """
+
+    def __init__(self, meta_collection, key: str, refresh_interval: float = 0.5):
+        self.meta = meta_collection
+        self.key = key
+        self.refresh_interval = refresh_interval
+        # None until the first read of the shared counter
+        self.shared: Optional[str] = None
+        # Local writes since start, and those not yet counted in MongoDB
+        self.local = 0
+        self.unsynced = 0
+        self._worker = str(ObjectId())
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def current(self) -> str:
+        if self.shared is None or self.unsynced:
+            # Unique to this worker, so it never matches a tag issued elsewhere
+            return f"{self.shared or ''}.{self._worker}-{self.local}"
+        return self.shared
+
+    def bump(self):
+        self.local += 1
+        self.unsynced += 1
+        self._wake.set()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sync(self):
+        """Publica las escrituras locales pendientes y lee el contador compartido."""
+        pending = self.unsynced
+        if pending:
+            # One increment covers every local write since the last sync
+            doc = await self.meta.find_one_and_update(
+                {"_id": self.key},
+                {"$inc": {"version": 1}, "$setOnInsert": {"epoch": str(ObjectId())}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        else:
+            doc = await self.meta.find_one({"_id": self.key})
+        self.shared = "0" if doc is None else f"{doc['epoch']}-{doc['version']}"
+        self.unsynced -= pending
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                await self.sync()
+            except PyMongoError as e:
+                # Unsynced writes keep the local suffix and are retried next round
+                print(f"⚠️  No se pudo sincronizar la versión de {self.key}: {e}")
+            try:
+                # A local write wakes the loop early so other workers see it soon
+                async with asyncio.timeout(self.refresh_interval):
+                    await self._wake.wait()
+            except TimeoutError:
+                pass
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" are the same tag
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
@@ -0,0 +1,7 @@
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Worker de gunicorn que corre uvicorn con uvloop y el parser httptools."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
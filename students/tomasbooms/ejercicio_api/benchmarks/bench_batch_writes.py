@@ -0,0 +1,62 @@
+"""
+Benchmark de escrituras por lote vs un request por item.
+
+- DELETE /items/{id} en un loop concurrente vs un solo DELETE /items con ids
+- PATCH /items/{id} en un loop concurrente vs un solo PATCH /items (bulk_write)
+
+    python benchmarks/bench_batch_writes.py --items 5000 --concurrency 50
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from common import base_parser, print_result, run_load
+
+
+async def seed(client: httpx.AsyncClient, n: int) -> list:
+    ids = []
+    for start in range(0, n, 5000):
+        batch = [{"name": f"batch-{i}", "price": 1 + i % 100} for i in range(start, min(start + 5000, n))]
+        response = await client.post("/items/bulk", json=batch, timeout=120)
+        ids.extend(item["id"] for item in response.json()["items"])
+    return ids
+
+
+async def timed(coro) -> float:
+    start = time.perf_counter()
+    response = await coro
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    print(f"  {response.json()}")
+    return elapsed
+
+
+async def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    args = parser.parse_args()
+    n = args.items
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=120) as client:
+        print("PATCH")
+        ids = await seed(client, n)
+        loop = await run_load(client, lambda c, i: c.patch(f"/items/{ids[i]}", json={"price": 2}), n, args.concurrency)
+        print_result("loop PATCH /items/{id}", loop)
+        bulk = await timed(client.patch("/items", json=[{"id": item_id, "price": 3} for item_id in ids]))
+        print(f"{'PATCH /items (bulk)':<28} {n / bulk:>9.1f} items/s  ({bulk * 1000:.0f} ms en total)")
+        print(f"Ganancia: {(n / bulk) / loop['ops_per_sec']:.1f}x")
+
+        print("\nDELETE")
+        loop_ids, batch_ids = await seed(client, n), ids
+        loop = await run_load(client, lambda c, i: c.delete(f"/items/{loop_ids[i]}"), n, args.concurrency)
+        print_result("loop DELETE /items/{id}", loop)
+        bulk = await timed(client.request("DELETE", "/items", json={"ids": batch_ids}))
+        print(f"{'DELETE /items (lote)':<28} {n / bulk:>9.1f} items/s  ({bulk * 1000:.0f} ms en total)")
+        print(f"Ganancia: {(n / bulk) / loop['ops_per_sec']:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""
+Benchmark de POST /items: respuesta armada localmente vs relectura en MongoDB.
+
+    python benchmarks/bench_create_item.py --requests 5000 --concurrency 100
+"""
+
+import asyncio
+
+import httpx
+
+from common import base_parser, print_result, run_load
+
+
+async def main():
+    args = base_parser(__doc__).parse_args()
+
+    def create(consistent: bool):
+        params = {"consistent": "true"} if consistent else {}
+
+        async def request(client: httpx.AsyncClient, i: int):
+            payload = {"name": f"bench-{i}", "description": "benchmark", "price": 1 + i % 100}
+            return await client.post("/items", json=payload, params=params)
+
+        return request
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        # Warm-up so connection setup does not count against either mode
+        await run_load(client, create(False), min(200, args.requests), args.concurrency)
+
+        fast = await run_load(client, create(False), args.requests, args.concurrency)
+        consistent = await run_load(client, create(True), args.requests, args.concurrency)
+
+    print_result("POST /items", fast)
+    print_result("POST /items?consistent=true", consistent)
+    print(f"Ganancia: {fast['ops_per_sec'] / consistent['ops_per_sec']:.2f}x ops/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
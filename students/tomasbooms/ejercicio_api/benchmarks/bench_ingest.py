@@ -0,0 +1,77 @@
+"""
+Benchmark de POST /items con muchos escritores concurrentes en los tres modos:
+`sync` (un insert_one por petición), `batched` (group commit, responde al
+escribirse el lote) y `async` (202 al encolar).
+
+    python benchmarks/bench_ingest.py --requests 20000 --concurrency 1000
+
+En modo async se espera además a que la cola termine de escribir todo,
+para comparar el throughput real de escritura y no solo el de encolado.
+Cada worker de gunicorn tiene su propia cola, así que no alcanza con esperar
+al último item encolado: se cuenta en /items/stats cuántos items de la
+corrida ya están en MongoDB. /items/stats sigue una escritura de otro worker
+con hasta ITEMS_VERSION_REFRESH segundos de retraso, y ese es el margen del
+tiempo de vaciado.
+"""
+
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from common import base_parser, print_result, run_load
+
+
+async def wait_until_written(client: httpx.AsyncClient, prefix: str, expected: int, timeout: float = 60) -> float:
+    """Segundos hasta que MongoDB tiene `expected` items cuyo nombre empieza con `prefix`."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        response = await client.get("/items/stats", params={"name_prefix": prefix})
+        if response.status_code == 200 and response.json()["count"] >= expected:
+            break
+        await asyncio.sleep(0.05)
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = base_parser(__doc__)
+    parser.set_defaults(requests=20000, concurrency=1000)
+    args = parser.parse_args()
+
+    # Names unique to this run, so the count ignores earlier runs
+    run = uuid.uuid4().hex[:8]
+    accepted = {"sync": 0, "batched": 0, "async": 0}
+
+    def create(mode: str):
+        async def request(client: httpx.AsyncClient, i: int):
+            payload = {"name": f"ingest-{run}-{mode}-{i}", "description": "benchmark", "price": 1 + i % 100}
+            response = await client.post("/items", json=payload, params={"mode": mode})
+            if response.status_code in (201, 202):
+                accepted[mode] += 1
+            return response
+
+        return request
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        await run_load(client, create("sync"), min(2000, args.requests), args.concurrency)
+
+        results = {}
+        for mode in ("sync", "batched", "async"):
+            accepted[mode] = 0
+            results[mode] = await run_load(client, create(mode), args.requests, args.concurrency)
+
+        # Requests rejected with 503 were never queued
+        drain = await wait_until_written(client, f"ingest-{run}-async-", accepted["async"])
+
+    for mode, result in results.items():
+        print_result(f"POST /items?mode={mode}", result)
+    written = results["async"]
+    total = written["seconds"] + drain
+    print(f"{'async hasta escribir todo':<28} {accepted['async'] / total:>9.1f} ops/s  (cola vaciada en {drain:.2f}s)")
+    print("Errores 503 = rechazos por cola llena (ver ingest_items_total en /metrics)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+Benchmark de GET /items/{item_id} con una carga Zipf (pocos ids muy calientes).
+
+Siembra `--items` items por escenario, los pide con probabilidad proporcional
+a 1/rango^s (o uniforme, como referencia) y reporta latencias junto con la tasa de aciertos de la caché (/cache/stats).
+Para comparar sin caché, levanta la API con ITEM_CACHE_SIZE=0.
+
+La caché y sus contadores viven en cada worker, y /cache/stats responde con
+los del worker que atiende esa petición: la tasa de aciertos solo es correcta
+con un worker (WEB_CONCURRENCY=1). Con `--workers` mayor que 1 el script la
+omite; las latencias siguen valiendo.
+
+    WEB_CONCURRENCY=1 docker-compose up -d
+    python benchmarks/bench_item_cache.py --items 10000 --zipf 1.1
+"""
+
+import asyncio
+import itertools
+import random
+
+import httpx
+
+from common import base_parser, print_result, run_load
+
+
+def zipf_sampler(ids: list, s: float, seed: int):
+    rng = random.Random(seed)
+    weights = list(itertools.accumulate(1 / rank ** s for rank in range(1, len(ids) + 1)))
+    return lambda: rng.choices(ids, cum_weights=weights)[0]
+
+
+async def seed(client: httpx.AsyncClient, n: int) -> list:
+    ids = []
+    for start in range(0, n, 5000):
+        batch = [{"name": f"zipf-{i}", "price": 1 + i % 100} for i in range(start, min(start + 5000, n))]
+        response = await client.post("/items/bulk", json=batch, timeout=120)
+        ids.extend(item["id"] for item in response.json()["items"])
+    return ids
+
+
+async def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--items", type=int, default=10000, help="Items distintos a sembrar")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Exponente s de la distribución")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=1, help="Workers de la API (WEB_CONCURRENCY)")
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        # Each scenario gets its own ids so one does not warm the cache for the other
+        zipf_ids = await seed(client, args.items)
+        uniform_ids = await seed(client, args.items)
+
+        uniform = random.Random(args.seed)
+        scenarios = {
+            f"zipf s={args.zipf}": zipf_sampler(zipf_ids, args.zipf, args.seed),
+            "uniforme": lambda: uniform.choice(uniform_ids),
+        }
+        for name, sample in scenarios.items():
+            before = (await client.get("/cache/stats")).json()["items"]
+            result = await run_load(
+                client, lambda c, i: c.get(f"/items/{sample()}"), args.requests, args.concurrency
+            )
+            after = (await client.get("/cache/stats")).json()["items"]
+            print_result(name, result)
+            if args.workers != 1:
+                print(f"{'':<28} tasa de aciertos omitida: /cache/stats es de un solo worker")
+                continue
+            hits = after["hits"] - before["hits"]
+            misses = after["misses"] - before["misses"]
+            print(f"{'':<28} aciertos={hits} fallos={misses} ratio={hits / max(1, hits + misses):.2%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
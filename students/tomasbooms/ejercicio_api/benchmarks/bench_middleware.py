@@ -0,0 +1,85 @@
+"""
+Costo por petición de MetricsMiddleware, medido en proceso llamando a la app
+ASGI directamente (sin red ni MongoDB). Falla si supera el presupuesto.
+
+    python benchmarks/bench_middleware.py --requests 20000 --budget-us 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+from instrumentation import MetricsMiddleware  # noqa: E402
+
+
+def build_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        return Response(content=b'{"id":"x"}', media_type="application/json")
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def per_request_seconds(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/abc",
+        "raw_path": b"/items/abc",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(500):  # warm-up
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    plain, instrumented = build_app(False), build_app(True)
+    overheads = []
+    for _ in range(args.repeat):
+        base = await per_request_seconds(plain, args.requests)
+        measured = await per_request_seconds(instrumented, args.requests)
+        overheads.append((measured - base) * 1e6)
+        print(f"sin middleware {base * 1e6:7.1f} µs   con middleware {measured * 1e6:7.1f} µs")
+
+    overhead = sorted(overheads)[len(overheads) // 2]
+    print(f"Costo del middleware (mediana): {overhead:.1f} µs por petición (presupuesto {args.budget_us} µs)")
+    if overhead > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+Latencia de un cliente normal mientras otro satura la API, con y sin
+control de admisión.
+
+El cliente normal (`X-API-Key: normal`) pide `GET /items?limit=20` a una
+tasa fija en lazo abierto. El abusivo (`X-API-Key: abusivo`) pide páginas
+de `--abuse-limit` items con `--abuse-concurrency` peticiones en vuelo y sin
+pausa. Cada escenario levanta la API con su propia configuración.
+
+    python benchmarks/bench_overload.py --stack memory --duration 20
+    python benchmarks/bench_overload.py --stack compose --rps 50 --abuse-concurrency 500
+"""
+
+import argparse
+import asyncio
+import random
+import subprocess
+from collections import Counter
+
+import httpx
+
+from common import DEFAULT_URL, wait_healthy
+from loadtest import COMPOSE_DIR, Workload, run_open_loop, start_stack
+
+SCENARIOS = {
+    "sin límites": {"RATE_LIMIT_RATE": "0", "MAX_IN_FLIGHT_REQUESTS": "0"},
+    "con límites": {
+        "RATE_LIMIT_RATE": "20",
+        "RATE_LIMIT_BURST": "40",
+        "RATE_LIMIT_API_KEYS": "normal,abusivo",
+        "MAX_IN_FLIGHT_REQUESTS": "64",
+    },
+}
+
+
+async def abuse(client: httpx.AsyncClient, limit: int, concurrency: int, stop: asyncio.Event) -> Counter:
+    statuses: Counter = Counter()
+
+    async def worker():
+        while not stop.is_set():
+            try:
+                response = await client.get("/items", params={"limit": limit})
+                statuses[response.status_code] += 1
+            except httpx.HTTPError:
+                statuses["error"] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return statuses
+
+
+async def run_scenario(args, env: dict) -> tuple:
+    url, server = start_stack(args.stack, args.url, env)
+    try:
+        limits = httpx.Limits(max_connections=args.abuse_concurrency + 100)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+            await wait_healthy(client)
+            await Workload(client, random.Random(0)).seed(args.seed_items)
+
+        async with httpx.AsyncClient(
+            base_url=url, headers={"X-API-Key": "normal"}, timeout=60
+        ) as normal, httpx.AsyncClient(
+            base_url=url, headers={"X-API-Key": "abusivo"}, limits=limits, timeout=60
+        ) as abusive:
+            stop = asyncio.Event()
+            abuser = asyncio.create_task(abuse(abusive, args.abuse_limit, args.abuse_concurrency, stop))
+            victim = Workload(normal, random.Random(1))
+            results = await run_open_loop(
+                victim, {"list": 1}, args.rps, args.duration, "constant", 10_000, random.Random(2)
+            )
+            stop.set()
+            statuses = await abuser
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return results["operations"]["list"], statuses
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stack", choices=("memory", "compose"), default="memory")
+    parser.add_argument("--url", default=DEFAULT_URL, help="URL base de la API con --stack compose")
+    parser.add_argument("--rps", type=float, default=10, help="Tasa del cliente normal")
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--abuse-concurrency", type=int, default=200)
+    parser.add_argument("--abuse-limit", type=int, default=1000, help="Tamaño de página del cliente abusivo")
+    parser.add_argument("--seed-items", type=int, default=2000)
+    args = parser.parse_args()
+
+    for name, env in SCENARIOS.items():
+        normal, statuses = await run_scenario(args, env)
+        print(
+            f"{name:<12} cliente normal: p50={normal['p50_ms']:.1f}ms p95={normal['p95_ms']:.1f}ms "
+            f"p99={normal['p99_ms']:.1f}ms errores={normal['error_rate']:.1%}"
+        )
+        total = sum(statuses.values())
+        summary = ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items(), key=str))
+        print(f"{'':<12} cliente abusivo: {total / args.duration:.0f} req/s ({summary})")
+
+    if args.stack == "compose":
+        # Leave the stack with its default configuration
+        subprocess.run(["docker-compose", "up", "-d"], cwd=COMPOSE_DIR, check=True, stdout=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
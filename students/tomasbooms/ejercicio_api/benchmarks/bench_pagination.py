@@ -0,0 +1,76 @@
+"""
+Benchmark de GET /items: página 1 vs página N en modo offset y keyset.
+
+Si la colección tiene menos de `page * limit` items, primero la llena
+con POST /items/bulk.
+
+    python benchmarks/bench_pagination.py --page 1000 --limit 10
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from common import base_parser, percentile
+
+SEED_BATCH = 5000
+
+
+async def seed(client: httpx.AsyncClient, needed: int):
+    response = await client.get("/items", params={"skip": needed - 1, "limit": 1})
+    if response.json():
+        return
+    print(f"Sembrando {needed} items...")
+    for start in range(0, needed, SEED_BATCH):
+        batch = [
+            {"name": f"page-{i}", "price": 1 + i % 100}
+            for i in range(start, min(start + SEED_BATCH, needed))
+        ]
+        await client.post("/items/bulk", json=batch, timeout=120)
+
+
+async def keyset_cursor(client: httpx.AsyncClient, page: int, limit: int):
+    cursor = None
+    for _ in range(page - 1):
+        params = {"paginate": "keyset", "limit": limit}
+        if cursor:
+            params["after"] = cursor
+        cursor = (await client.get("/items", params=params)).json()["next_cursor"]
+    return cursor
+
+
+async def measure(client: httpx.AsyncClient, params: dict, repeat: int) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.get("/items", params=params)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return {"p50_ms": percentile(latencies, 50) * 1000, "p99_ms": percentile(latencies, 99) * 1000}
+
+
+async def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--page", type=int, default=1000, help="Página profunda a medir")
+    parser.add_argument("--limit", type=int, default=10, help="Items por página")
+    parser.add_argument("--repeat", type=int, default=200, help="Mediciones por escenario")
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        await seed(client, args.page * args.limit)
+        deep_cursor = await keyset_cursor(client, args.page, args.limit)
+
+        scenarios = {
+            "offset página 1": {"limit": args.limit},
+            f"offset página {args.page}": {"skip": (args.page - 1) * args.limit, "limit": args.limit},
+            "keyset página 1": {"paginate": "keyset", "limit": args.limit},
+            f"keyset página {args.page}": {"after": deep_cursor, "limit": args.limit},
+        }
+        for name, params in scenarios.items():
+            result = await measure(client, params, args.repeat)
+            print(f"{name:<24} p50={result['p50_ms']:.2f}ms  p99={result['p99_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark del camino de lectura: costo en Python de serializar una
+página de items, sin red ni MongoDB.
+
+- modelos: copia cada documento, renombra _id -> id, construye ItemResponse y
+  deja que FastAPI valide y serialice con response_model.
+- orjson: los documentos ya vienen proyectados desde MongoDB ($project) y se
+  codifican una sola vez con orjson.
+
+    python benchmarks/bench_serialization.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+from typing import List
+
+import orjson
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+from main import ItemResponse  # noqa: E402
+
+response_adapter = TypeAdapter(List[ItemResponse])
+
+
+def mongo_docs(n: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {"_id": ObjectId(), "name": f"item-{i}", "description": "descripción", "price": 9.99 + i, "created_at": now}
+        for i in range(n)
+    ]
+
+
+def projected_docs(docs: list) -> list:
+    return [
+        {"id": str(d["_id"]), "name": d["name"], "description": d["description"], "price": d["price"], "created_at": d["created_at"]}
+        for d in docs
+    ]
+
+
+def models_path(docs: list) -> bytes:
+    items = []
+    for doc in docs:
+        item = dict(doc)
+        item["id"] = str(item["_id"])
+        del item["_id"]
+        items.append(ItemResponse(**item))
+    # What FastAPI does with response_model: validate, dump to JSON types, json.dumps
+    validated = response_adapter.validate_python(items)
+    content = response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def orjson_path(docs: list) -> bytes:
+    return orjson.dumps(docs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'items':>6} {'modelos (µs)':>14} {'orjson (µs)':>13} {'ganancia':>9}")
+    for size in args.sizes:
+        docs = mongo_docs(size)
+        projected = projected_docs(docs)
+        number = max(1, 20000 // size)
+        slow = min(timeit.repeat(lambda: models_path(docs), number=number, repeat=args.repeat)) / number
+        fast = min(timeit.repeat(lambda: orjson_path(projected), number=number, repeat=args.repeat)) / number
+        print(f"{size:>6} {slow * 1e6:>14.1f} {fast * 1e6:>13.1f} {slow / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
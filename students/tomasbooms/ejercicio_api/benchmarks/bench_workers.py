@@ -0,0 +1,55 @@
+"""
+Escalamiento de RPS de 1 a N workers contra el stack de Docker Compose.
+
+Para cada cantidad de workers recrea el servicio `fastapi` con
+WEB_CONCURRENCY=<n>, espera a que /health responda y mide GET /items.
+
+    python benchmarks/bench_workers.py --max-workers 4 --requests 5000 --concurrency 200
+"""
+
+import asyncio
+import os
+import subprocess
+
+import httpx
+
+from common import base_parser, print_result, run_load, wait_healthy
+
+COMPOSE_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+
+def restart_api(workers: int):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers))
+    subprocess.run(
+        ["docker-compose", "up", "-d", "--build", "--force-recreate", "fastapi"],
+        cwd=COMPOSE_DIR,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+async def main():
+    parser = base_parser(__doc__)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    results = {}
+    for workers in range(1, args.max_workers + 1):
+        restart_api(workers)
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            await wait_healthy(client)
+            # Warm-up: let every worker open its Mongo connections
+            await run_load(client, lambda c, i: c.get("/items"), 500, args.concurrency)
+            results[workers] = await run_load(client, lambda c, i: c.get("/items"), args.requests, args.concurrency)
+        print_result(f"{workers} worker(s)", results[workers])
+
+    base = results[1]["ops_per_sec"]
+    print("\nEscalamiento respecto a 1 worker:")
+    for workers, result in results.items():
+        print(f"  {workers:>2} workers: {result['ops_per_sec'] / base:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
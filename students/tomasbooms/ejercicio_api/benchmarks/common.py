@@ -0,0 +1,91 @@
+"""
+Utilidades compartidas por los benchmarks de la API.
+
+Los benchmarks corren contra una API levantada con `docker-compose up -d`
+(por defecto http://localhost:8000) y usan un cliente HTTP asíncrono.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+DEFAULT_URL = "http://localhost:8000"
+
+
+def base_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--url", default=DEFAULT_URL, help="URL base de la API")
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones por escenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="Peticiones en vuelo")
+    return parser
+
+
+async def wait_healthy(client: httpx.AsyncClient, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.5)
+    raise RuntimeError("La API no respondió a /health a tiempo")
+
+
+def percentile(samples: List[float], p: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * p / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    request: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]],
+    total: int,
+    concurrency: int,
+) -> dict:
+    """Ejecuta `total` peticiones con `concurrency` en vuelo y resume latencias."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await request(client, i)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "seconds": elapsed,
+        "ops_per_sec": total / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def print_result(name: str, result: dict):
+    print(
+        f"{name:<28} {result['ops_per_sec']:>9.1f} ops/s  "
+        f"p50={result['p50_ms']:.2f}ms  p99={result['p99_ms']:.2f}ms  "
+        f"errores={result['errors']}"
+    )
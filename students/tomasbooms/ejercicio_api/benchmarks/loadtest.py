@@ -0,0 +1,293 @@
+"""
+Prueba de carga de la API de items con llegadas en lazo abierto.
+
+Las peticiones se lanzan a una tasa fija (`--arrival constant`) o con
+llegadas de Poisson (`--arrival poisson`) sin esperar a que terminen las
+anteriores, y la latencia se mide desde el instante programado: una API
+lenta no reduce la carga que recibe ni esconde su cola de espera. La mezcla
+de operaciones se elige con `--mix`, con el nombre de una de MIXES o con
+pesos (`create=10,list=60,get=25,delete=5`).
+
+    python benchmarks/loadtest.py --stack memory --rps 200 --duration 30
+    python benchmarks/loadtest.py --stack compose --mix write_heavy --rps 500
+    python benchmarks/loadtest.py --stack memory --baseline benchmarks/baselines/memory.json
+
+`--stack memory` levanta la API con mongomock (memory_server.py),
+`--stack compose` con `docker-compose up -d` y `--stack url` usa la API que
+ya esté corriendo en `--url`. Con `--baseline` termina con código 1 si el
+p50/p95/p99 de alguna operación supera al del archivo en más de
+`--tolerance` (más `--slack-ms`), o si su tasa de errores sube más de un
+punto; `--save-baseline` guarda la corrida actual como nueva referencia.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from common import DEFAULT_URL, percentile, wait_healthy
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPOSE_DIR = os.path.join(BENCH_DIR, "..")
+
+OPERATIONS = ("create", "list", "get", "delete")
+MIXES = {
+    "read_heavy": {"create": 5, "list": 60, "get": 33, "delete": 2},
+    "balanced": {"create": 25, "list": 35, "get": 30, "delete": 10},
+    "write_heavy": {"create": 60, "list": 10, "get": 15, "delete": 15},
+}
+# Percentile checked against the baseline -> its quantile. A percentile is
+# only compared when at least MIN_TAIL_SAMPLES samples lie beyond it;
+# otherwise p99 of a few hundred requests is just the slowest few of them.
+LATENCY_KEYS = {"p50_ms": 0.50, "p95_ms": 0.95, "p99_ms": 0.99}
+MIN_TAIL_SAMPLES = 10
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    if value in MIXES:
+        return MIXES[value]
+    weights = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Operación desconocida: {name} (usa {', '.join(OPERATIONS)})")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Peso inválido para {name}: {weight!r}")
+    return weights
+
+
+class Workload:
+    """
+    Operaciones de la mezcla. Los GET leen solo items sembrados al inicio y
+    los DELETE borran solo items creados durante la prueba, así un GET nunca
+    apunta a un item que otra petición acaba de eliminar.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random):
+        self.client = client
+        self.rng = rng
+        self.seeded: List[str] = []
+        self.created: List[str] = []
+
+    async def seed(self, count: int):
+        payload = [{"name": f"seed-{i}", "description": "loadtest", "price": 1 + i % 100} for i in range(count)]
+        for start in range(0, count, 1000):
+            response = await self.client.post("/items/bulk", json=payload[start:start + 1000])
+            response.raise_for_status()
+            self.seeded += [item["id"] for item in response.json()["items"]]
+
+    async def run(self, op: str) -> Tuple[str, httpx.Response]:
+        if op == "get" and self.seeded:
+            return op, await self.client.get(f"/items/{self.rng.choice(self.seeded)}")
+        if op == "list":
+            return op, await self.client.get("/items", params={"limit": 20, "skip": self.rng.randrange(100)})
+        if op == "delete" and self.created:
+            index = self.rng.randrange(len(self.created))
+            self.created[index], self.created[-1] = self.created[-1], self.created[index]
+            return op, await self.client.delete(f"/items/{self.created.pop()}")
+        # create, or get/delete with nothing to target yet
+        payload = {"name": "loadtest", "description": "loadtest", "price": self.rng.uniform(1, 1000)}
+        response = await self.client.post("/items", json=payload)
+        if response.status_code == 201:
+            self.created.append(response.json()["id"])
+        return "create", response
+
+
+async def run_open_loop(
+    workload: Workload,
+    mix: Dict[str, float],
+    rps: float,
+    duration: float,
+    arrival: str,
+    max_in_flight: int,
+    rng: random.Random,
+) -> dict:
+    loop = asyncio.get_running_loop()
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    in_flight = set()
+    dropped = 0
+    names, weights = list(mix), list(mix.values())
+
+    async def fire(op: str, scheduled: float):
+        try:
+            op, response = await workload.run(op)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        # From the scheduled time, so time waiting behind a slow API counts
+        latencies[op].append(loop.time() - scheduled)
+        if failed:
+            errors[op] += 1
+
+    start = loop.time()
+    next_at = start
+    while next_at - start < duration:
+        delay = next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            # The client itself is saturated; report it instead of queueing
+            dropped += 1
+        else:
+            task = asyncio.create_task(fire(rng.choices(names, weights)[0], next_at))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        next_at += rng.expovariate(rps) if arrival == "poisson" else 1 / rps
+    await asyncio.gather(*in_flight)
+    elapsed = loop.time() - start
+
+    operations = {op: _summarize(samples, errors[op], elapsed) for op, samples in sorted(latencies.items())}
+    every = [sample for samples in latencies.values() for sample in samples]
+    operations["all"] = _summarize(every, sum(errors.values()), elapsed)
+    return {"seconds": elapsed, "dropped": dropped, "operations": operations}
+
+
+def _summarize(samples: List[float], errors: int, elapsed: float) -> dict:
+    return {
+        "count": len(samples),
+        "errors": errors,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "throughput": len(samples) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, slack_ms: float) -> List[str]:
+    """Regresiones de la corrida actual respecto al baseline, como mensajes legibles."""
+    failures = []
+    for op, base in baseline["operations"].items():
+        current = results["operations"].get(op)
+        if current is None:
+            continue
+        for key, quantile in LATENCY_KEYS.items():
+            if current["count"] * (1 - quantile) < MIN_TAIL_SAMPLES:
+                continue
+            limit = base[key] * (1 + tolerance) + slack_ms
+            if current[key] > limit:
+                failures.append(f"{op} {key}: {current[key]:.2f} ms > {limit:.2f} ms (baseline {base[key]:.2f} ms)")
+        if current["error_rate"] > base["error_rate"] + 0.01:
+            failures.append(
+                f"{op} error_rate: {current['error_rate']:.2%} > {base['error_rate']:.2%} + 1 punto"
+            )
+    return failures
+
+
+def print_report(config: dict, results: dict):
+    print(
+        f"{config['rps']:.0f} req/s ofrecidas ({config['arrival']}) durante {results['seconds']:.1f}s, "
+        f"mezcla {config['mix']}, {results['dropped']} descartadas por el cliente"
+    )
+    print(f"{'operación':<10} {'total':>7} {'req/s':>9} {'errores':>8} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for op, r in results["operations"].items():
+        print(
+            f"{op:<10} {r['count']:>7} {r['throughput']:>9.1f} {r['error_rate']:>8.2%} "
+            f"{r['p50_ms']:>7.2f}ms {r['p95_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms"
+        )
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stack(stack: str, url: str, env: Optional[Dict[str, str]] = None) -> Tuple[str, Optional[subprocess.Popen]]:
+    """Levanta la API; `env` son variables de configuración para ella (con compose, las de docker-compose.yml)."""
+    env = dict(os.environ, **(env or {}))
+    if stack == "memory":
+        port = _free_port()
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(BENCH_DIR, "memory_server.py"), "--port", str(port)], env=env
+        )
+        return f"http://127.0.0.1:{port}", server
+    if stack == "compose":
+        subprocess.run(
+            ["docker-compose", "up", "-d", "--build"], cwd=COMPOSE_DIR, env=env, check=True, stdout=subprocess.DEVNULL
+        )
+    return url, None
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stack", choices=("url", "memory", "compose"), default="url")
+    parser.add_argument("--url", default=DEFAULT_URL, help="URL base de la API con --stack url/compose")
+    parser.add_argument("--down", action="store_true", help="docker-compose down al terminar (--stack compose)")
+    parser.add_argument("--mix", type=parse_mix, default="read_heavy", help=f"{', '.join(MIXES)} o pesos op=n,...")
+    parser.add_argument("--rps", type=float, default=100, help="Peticiones por segundo ofrecidas")
+    parser.add_argument("--duration", type=float, default=30, help="Segundos de carga")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="poisson")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Peticiones simultáneas del cliente")
+    parser.add_argument("--seed-items", type=int, default=1000, help="Items creados antes de medir")
+    parser.add_argument("--random-seed", type=int, default=1)
+    parser.add_argument("--output", help="Guarda el resultado en este archivo JSON")
+    parser.add_argument("--baseline", help="Archivo JSON contra el que comparar")
+    parser.add_argument("--save-baseline", action="store_true", help="Sobrescribe --baseline con esta corrida")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Empeoramiento relativo tolerado")
+    parser.add_argument("--slack-ms", type=float, default=2.0, help="Margen absoluto tolerado, en ms")
+    args = parser.parse_args()
+
+    rng = random.Random(args.random_seed)
+    config = {"rps": args.rps, "duration": args.duration, "arrival": args.arrival, "mix": args.mix, "stack": args.stack}
+
+    url, server = start_stack(args.stack, args.url)
+    try:
+        limits = httpx.Limits(max_connections=args.max_in_flight)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+            await wait_healthy(client)
+            workload = Workload(client, rng)
+            await workload.seed(args.seed_items)
+            # Warm-up: connections, caches and the first pages of the collection
+            await run_open_loop(workload, args.mix, args.rps, min(5, args.duration), args.arrival, args.max_in_flight, rng)
+            results = await run_open_loop(
+                workload, args.mix, args.rps, args.duration, args.arrival, args.max_in_flight, rng
+            )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if args.stack == "compose" and args.down:
+            subprocess.run(["docker-compose", "down"], cwd=COMPOSE_DIR, check=True, stdout=subprocess.DEVNULL)
+
+    print_report(config, results)
+    report = {"config": config, **results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline guardado en {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("config") != config:
+        print(f"\n⚠️ La configuración difiere del baseline: {baseline.get('config')}")
+    failures = compare(report, baseline, args.tolerance, args.slack_ms)
+    if failures:
+        print("\n❌ Regresión de latencia respecto al baseline:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n✅ Sin regresiones respecto al baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
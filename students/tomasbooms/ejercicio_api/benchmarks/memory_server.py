@@ -0,0 +1,39 @@
+"""
+Levanta la API con una base de datos en memoria (mongomock-motor) en lugar de
+MongoDB, para correr `loadtest.py` sin Docker. Los tiempos de base de datos
+no son representativos: sirve para medir la capa HTTP/Python y detectar
+regresiones en ella.
+
+    python benchmarks/memory_server.py --port 8100
+"""
+
+import argparse
+import os
+import sys
+
+import mongomock_motor
+import motor.motor_asyncio
+import uvicorn
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    # main.py binds AsyncIOMotorClient by name when it is imported, and its
+    # lifespan (connect_mongo) builds the client from that name: swap first
+    motor.motor_asyncio.AsyncIOMotorClient = mongomock_motor.AsyncMongoMockClient
+    # mongomock has no change streams
+    os.environ.setdefault("FEED_MODE", "poll")
+    sys.path.insert(0, APP_DIR)
+    from main import app
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
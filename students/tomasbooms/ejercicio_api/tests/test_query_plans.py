@@ -0,0 +1,87 @@
+"""
+Planes de ejecución de las consultas de GET /items contra un mongod real.
+
+mongomock no tiene planificador, así que estos tests levantan un mongod local
+con pymongo_inmemory (lo descarga la primera vez; PYMONGOIM__MONGO_VERSION
+elige la versión, por defecto la de docker-compose.yml) y se saltan si no se
+puede arrancar.
+
+    pip install -r tests/requirements.txt
+    python -m pytest tests/test_query_plans.py
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from indexes import ITEM_INDEXES, summarize_plan
+from queries import ItemFilters, after_condition, keyset_pipeline, offset_pipeline
+
+pymongo_inmemory = pytest.importorskip("pymongo_inmemory")
+
+START = datetime(2024, 1, 1)
+SAMPLE_SIZE = 2000
+
+
+@pytest.fixture(scope="module")
+def collection():
+    os.environ.setdefault("PYMONGOIM__MONGO_VERSION", "7.0")
+    try:
+        client = pymongo_inmemory.MongoClient()
+    except Exception as e:
+        pytest.skip(f"No se pudo arrancar un mongod local: {e}")
+    try:
+        items = client.plans.items
+        items.create_indexes(ITEM_INDEXES)
+        # Enough documents that the planner compares real candidate plans
+        items.insert_many(
+            {"name": f"Producto {i:04d}", "price": 1 + i % 500, "created_at": START + timedelta(minutes=i)}
+            for i in range(SAMPLE_SIZE)
+        )
+        yield items
+    finally:
+        client.close()
+
+
+def explain(collection, pipeline):
+    command = {"aggregate": collection.name, "pipeline": pipeline, "cursor": {}}
+    return summarize_plan(collection.database.command({"explain": command, "verbosity": "queryPlanner"}))
+
+
+by_price = ItemFilters(min_price=10, max_price=100)
+recent = ItemFilters(created_after=START + timedelta(days=1))
+by_name = ItemFilters(name_prefix="Producto 01")
+last_id = ObjectId()
+
+PLANS = {
+    # Filters alone (offset mode, no sort)
+    "filter_price": (offset_pipeline(by_price, None, 0, 10), "price_id"),
+    "filter_created_at": (offset_pipeline(recent, None, 0, 10), "created_at_id"),
+    "filter_name_prefix": (offset_pipeline(by_name, None, 0, 10), "name_id"),
+    # Sorts alone: the index order replaces the in-memory sort
+    "sort_price": (offset_pipeline(ItemFilters(), "price", 0, 10), "price_id"),
+    "sort_created_at_desc": (offset_pipeline(ItemFilters(), "-created_at", 0, 10), "created_at_id"),
+    # Keyset pages: first page and a page after a cursor, with and without filters
+    "keyset_id": (keyset_pipeline(ItemFilters(), "_id", {"_id": {"$gt": last_id}}, 11), "_id_"),
+    "keyset_price_first": (keyset_pipeline(by_price, "-price", None, 11), "price_id"),
+    "keyset_price_after": (
+        keyset_pipeline(by_price, "-price", after_condition("-price", 50, last_id), 11),
+        "price_id",
+    ),
+    "keyset_created_at_after": (
+        keyset_pipeline(recent, "created_at", after_condition("created_at", START + timedelta(days=2), last_id), 11),
+        "created_at_id",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", PLANS)
+def test_winning_plan_uses_index(collection, name):
+    pipeline, index = PLANS[name]
+    plan = explain(collection, pipeline)
+    assert "IXSCAN" in plan["stages"], plan["stages"]
+    assert not plan["collection_scan"], plan["stages"]
+    assert "SORT" not in plan["stages"], plan["stages"]
+    assert set(plan["indexes"]) == {index}, plan["indexes"]
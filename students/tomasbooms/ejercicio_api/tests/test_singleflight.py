@@ -0,0 +1,96 @@
+"""
+Lecturas idénticas concurrentes hacen una sola consulta a MongoDB
+(single-flight). La API corre en proceso sobre mongomock y cada `aggregate`
+se retrasa para que las peticiones coincidan.
+"""
+
+import asyncio
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+httpx = pytest.importorskip("httpx")
+
+import main as api  # noqa: E402
+
+CONCURRENCY = 50
+DELAY = 0.1
+
+
+class SlowCollection:
+    """Delega en la colección real, contando los `aggregate` y retrasando sus resultados."""
+
+    def __init__(self, collection, delay: float):
+        self._collection = collection
+        self.delay = delay
+        self.aggregates = 0
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        self.aggregates += 1
+        cursor = self._collection.aggregate(pipeline, *args, **kwargs)
+        delay = self.delay
+
+        class Cursor:
+            async def to_list(self, length=None):
+                await asyncio.sleep(delay)
+                return await cursor.to_list(length=length)
+
+        return Cursor()
+
+
+@pytest.fixture
+def run_api(monkeypatch):
+    """Corre `scenario(client, slow, item_id)` contra la API con un item creado."""
+    monkeypatch.setattr(api, "AsyncIOMotorClient", mongomock_motor.AsyncMongoMockClient)
+    # mongomock has no change streams
+    monkeypatch.setattr(api.settings, "feed_mode", "poll")
+    # Without the item cache every request reaches the database
+    monkeypatch.setattr(api.item_cache, "maxsize", 0)
+
+    async def run(scenario):
+        async with api.lifespan(api.app):
+            transport = httpx.ASGITransport(app=api.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                created = await client.post("/items", json={"name": "singleflight", "price": 1})
+                slow = SlowCollection(api.collection, DELAY)
+                api.collection = slow
+                try:
+                    await scenario(client, slow, created.json()["id"])
+                finally:
+                    api.collection = slow._collection
+
+    return lambda scenario: asyncio.run(run(scenario))
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/items/{item_id}", "/items?skip=0&limit=10", "/items?paginate=keyset&limit=10"],
+)
+def test_concurrent_identical_reads_share_one_query(run_api, path):
+    async def scenario(client, slow, item_id):
+        url = path.format(item_id=item_id)
+        responses = await asyncio.gather(*(client.get(url) for _ in range(CONCURRENCY)))
+        assert {r.status_code for r in responses} == {200}
+        assert len({r.content for r in responses}) == 1
+        assert slow.aggregates == 1
+
+    run_api(scenario)
+
+
+def test_read_after_write_does_not_join_earlier_read(run_api):
+    async def scenario(client, slow, item_id):
+        url = f"/items/{item_id}"
+        earlier = asyncio.ensure_future(client.get(url))
+        # Let the first read reach the database before writing
+        await asyncio.sleep(DELAY / 4)
+        assert slow.aggregates == 1
+        await client.patch(url, json={"name": "cambiado"})
+        later = await client.get(url)
+        assert later.json()["name"] == "cambiado"
+        assert (await earlier).status_code == 200
+        assert slow.aggregates == 2
+
+    run_api(scenario)